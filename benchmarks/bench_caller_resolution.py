@@ -0,0 +1,65 @@
+"""Per-call cost of resolving the calling module's domain.
+
+Compares the previous ``inspect.stack()`` based lookup with the cached
+frame walk used by ``_resolve_domain_for_call``.
+
+Usage: PYTHONPATH=. python benchmarks/bench_caller_resolution.py [--depth N] [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import sys
+import timeit
+import types
+
+import i18n_core
+from i18n_core import REGISTRY
+
+
+def _legacy_calling_module_name():
+    for frame_info in inspect.stack()[2:]:
+        mod_name = frame_info.frame.f_globals.get("__name__")
+        if not mod_name or mod_name.startswith("i18n_core"):
+            continue
+        return mod_name
+    return None
+
+
+def _legacy_resolve_domain_for_call():
+    mod_name = _legacy_calling_module_name()
+    if not mod_name:
+        return REGISTRY.get_default_domain()
+    mapped = REGISTRY.get_module_domain(mod_name)
+    if mapped:
+        return mapped
+    module_obj = sys.modules.get(mod_name)
+    return i18n_core.ensure_inferred_provider(mod_name, getattr(module_obj, "__file__", None))
+
+
+def _make_caller(depth: int) -> types.ModuleType:
+    # A module outside i18n_core that calls the resolver `depth` frames deep
+    mod = types.ModuleType("bench_caller")
+    exec("def call(fn, n):\n    return fn() if n == 0 else call(fn, n - 1)\n", mod.__dict__)
+    sys.modules[mod.__name__] = mod
+    mod.depth = depth
+    return mod
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=20, help="extra stack frames above the caller")
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args(argv)
+
+    mod = _make_caller(args.depth)
+    REGISTRY.set_module_domain(mod.__name__, "bench_domain")
+    resolvers = (("inspect.stack", _legacy_resolve_domain_for_call), ("cached frame walk", i18n_core._resolve_domain_for_call))
+    for label, fn in resolvers:
+        best = min(timeit.repeat(lambda: mod.call(fn, mod.depth), number=args.number, repeat=5))
+        print(f"{label:>18}: {best / args.number * 1e6:9.2f} us/call (depth={args.depth})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Benchmark suite over synthetic catalogs.
+
+Generates ``.mo`` catalogs in pure Python (no msgfmt) for every combination
+of ``--entries`` and ``--domains`` and measures:
+
+- ``_()``, ``ngettext()`` and ``__()`` latency through builtins and through
+  ``install_module_translation``;
+- cold and warm ``get_domain_translations``;
+- ``set_locale`` switch cost, to a new locale and back to a cached one;
+- multi-threaded lookup throughput.
+
+Results are written as JSON (stdout or ``--output``) so runs can be compared.
+
+Usage: PYTHONPATH=. python benchmarks/suite.py [--entries 1000,20000] [--domains 1,50] [--output out.json]
+       PYTHONPATH=. python benchmarks/suite.py --full   # 1k-200k entries, 1-200 domains
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, List
+
+import i18n_core
+from i18n_core import REGISTRY
+from i18n_core.mofile import write_mo
+from i18n_core.registry import _Registry
+
+LOCALES = ("de", "fr")
+HEADER = b"Content-Type: text/plain; charset=UTF-8\nPlural-Forms: nplurals=2; plural=(n != 1);\n"
+
+
+def generate_catalogs(root: str, domains: List[str], entries: int) -> None:
+    """Write <root>/<locale>/LC_MESSAGES/<domain>.mo with `entries` messages each."""
+    for loc in LOCALES:
+        lc_dir = os.path.join(root, loc, "LC_MESSAGES")
+        os.makedirs(lc_dir, exist_ok=True)
+        for domain in domains:
+            messages = {b"": HEADER}
+            for i in range(entries):
+                if i % 10 == 0:
+                    messages[f"item {i}\0items {i}".encode()] = f"{loc} item {i}\0{loc} items {i}".encode()
+                else:
+                    messages[f"message {i}".encode()] = f"{loc} message {i}".encode()
+            with open(os.path.join(lc_dir, f"{domain}.mo"), "wb") as fp:
+                write_mo(fp, messages)
+
+
+def per_call(fn: Callable[[int], Any], calls: int, repeat: int = 5) -> float:
+    """Best-of-`repeat` seconds per call of fn(calls), which performs `calls` operations."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(calls)
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+def make_caller(name: str, domain: str, install: bool, entries: int) -> types.ModuleType:
+    """A module whose loops call _/ngettext/__ either from builtins or installed wrappers."""
+    mod = types.ModuleType(name)
+    mod.__file__ = os.path.join(tempfile.gettempdir(), name, "__init__.py")
+    sys.modules[name] = mod
+    if install:
+        i18n_core.install_module_translation(domain=domain, module=mod, locale_path=os.path.dirname(mod.__file__))
+    else:
+        REGISTRY.set_module_domain(name, domain)
+    keys = [f"message {i}" for i in range(entries) if i % 10][:1000] or ["message 1"]
+    mod.KEYS, mod.NKEYS = keys, len(keys)
+    exec(
+        "def gettext_loop(n):\n"
+        "    for i in range(n):\n"
+        "        _(KEYS[i % NKEYS])\n"
+        "def ngettext_loop(n):\n"
+        "    for i in range(n):\n"
+        "        ngettext('item 10', 'items 10', i)\n"
+        "def lazy_loop(n):\n"
+        "    for i in range(n):\n"
+        "        str(__(KEYS[i % NKEYS]))\n",
+        mod.__dict__,
+    )
+    return mod
+
+
+def bench_lookups(domain: str, entries: int, calls: int) -> Dict[str, float]:
+    results = {}
+    for label, install in (("builtins", False), ("module", True)):
+        mod = make_caller(f"bench_{label}_{domain}", domain, install, entries)
+        mod.gettext_loop(100)  # warm caches
+        results[f"{label}_gettext_us"] = per_call(mod.gettext_loop, calls) * 1e6
+        results[f"{label}_ngettext_us"] = per_call(mod.ngettext_loop, calls) * 1e6
+        results[f"{label}_lazy_us"] = per_call(mod.lazy_loop, calls) * 1e6
+    return results
+
+
+def bench_registry(root: str, domains: List[str], backend: str) -> Dict[str, float]:
+    reg = _Registry(max_cached_locales=len(LOCALES) + 1)
+    reg.set_catalog_backend(backend)
+    reg.enable_stats(False)
+    for domain in domains:
+        reg.register_domain(domain, root, source="bench")
+    reg.set_locale("de_DE")
+
+    start = time.perf_counter()
+    for domain in domains:
+        reg.get_domain_translations(domain)
+    cold = time.perf_counter() - start
+
+    def warm(n: int) -> None:
+        for i in range(n):
+            reg.get_domain_translations(domains[i % len(domains)])
+
+    warm_us = per_call(warm, 10000) * 1e6
+
+    def switch(locale_id: str) -> float:
+        start = time.perf_counter()
+        reg.set_locale(locale_id)
+        for domain in domains:
+            reg.get_domain_translations(domain)
+        return time.perf_counter() - start
+
+    switch_new = switch("fr_FR")
+    switch_back = switch("de_DE")
+    return {
+        "cold_load_all_domains_s": cold,
+        "cold_load_per_domain_ms": cold / len(domains) * 1e3,
+        "warm_get_domain_translations_us": warm_us,
+        "set_locale_new_s": switch_new,
+        "set_locale_cached_s": switch_back,
+    }
+
+
+def bench_threads(domain: str, entries: int, threads: int, duration: float) -> Dict[str, float]:
+    mod = make_caller(f"bench_threads_{domain}", domain, True, entries)
+    counts = [0] * threads
+    stop = threading.Event()
+
+    def worker(slot: int) -> None:
+        while not stop.is_set():
+            mod.gettext_loop(1000)
+            counts[slot] += 1000
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    time.sleep(duration)
+    stop.set()
+    for w in workers:
+        w.join()
+    return {"threads": threads, "lookups_per_s": sum(counts) / duration}
+
+
+def run(entries_list: List[int], domains_list: List[int], backend: str, calls: int, threads: int) -> Dict[str, Any]:
+    REGISTRY.set_catalog_backend(backend)
+    REGISTRY.enable_stats(False)
+    scenarios = []
+    with tempfile.TemporaryDirectory(prefix="i18n-bench-") as tmp:
+        for entries in entries_list:
+            for n_domains in domains_list:
+                root = os.path.join(tmp, f"e{entries}_d{n_domains}")
+                domains = [f"bench_e{entries}_d{n_domains}_{i}" for i in range(n_domains)]
+                start = time.perf_counter()
+                generate_catalogs(root, domains, entries)
+                generated = time.perf_counter() - start
+                for domain in domains:
+                    REGISTRY.register_domain(domain, root, source="bench")
+                i18n_core.set_locale("de_DE")
+                scenario: Dict[str, Any] = {"entries": entries, "domains": n_domains, "generate_s": generated}
+                scenario["registry"] = bench_registry(root, domains, backend)
+                scenario["lookups"] = bench_lookups(domains[0], entries, calls)
+                scenario["threaded"] = bench_threads(domains[0], entries, threads, duration=0.5)
+                scenarios.append(scenario)
+                print(f"done: entries={entries} domains={n_domains}", file=sys.stderr)
+    return {
+        "timestamp": time.time(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "backend": backend,
+        "scenarios": scenarios,
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=_int_list, default=[1000, 20000], help="comma separated catalog sizes")
+    parser.add_argument("--domains", type=_int_list, default=[1, 50], help="comma separated domain counts")
+    parser.add_argument("--full", action="store_true", help="use 1k,20k,200k entries and 1,50,200 domains")
+    parser.add_argument("--backend", choices=("babel", "mmap"), default="babel")
+    parser.add_argument("--calls", type=int, default=20000, help="calls per latency measurement")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+    if args.full:
+        args.entries, args.domains = [1000, 20000, 200000], [1, 50, 200]
+
+    # Keep builtins._ and friends dynamic for the builtins measurements
+    i18n_core.install_translation_into_module(builtins)
+    report = run(args.entries, args.domains, args.backend, args.calls, args.threads)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,33 @@
-from __future__ import absolute_import
+from __future__ import absolute_import, annotations
 
-import ctypes
-import datetime
 import locale
 import os
-import platform
 import sys
+import threading
+import time
 from logging import getLogger
 from types import ModuleType
-from typing import Any, Callable, Iterable, Optional
-
-import babel.core
-from babel import support
-from platform_utils import paths
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+from . import locale_index, plurals
+from .lazy import LazyString
+from .negotiation import negotiate_locale
 from .registry import (
     DEFAULT_LOCALE,
     REGISTRY,
+    _LocaleOverride,
     ensure_inferred_provider,
+    get_calling_frame,
     get_calling_module_name,
     infer_domain_from_module,
 )
 
+if TYPE_CHECKING:
+    # Babel, ctypes and platform_utils are imported on first use to keep
+    # ``import i18n_core`` cheap
+    import babel.core
+    from babel import support
+
 logger = getLogger("i18n_core")
 
 
@@ -33,8 +39,6 @@ except ImportError:
 
 CURRENT_LOCALE: str = DEFAULT_LOCALE
 
-# Back-compat placeholder; dynamically computed from default domain
-active_translation: support.Translations = support.Translations()
 application_locale_path: Optional[str] = None
 
 
@@ -42,6 +46,15 @@ def patch() -> None:
     from . import patches
 
 
+def __getattr__(name: str) -> Any:
+    if name == "active_translation":
+        # Back-compat placeholder until set_locale() binds the default domain
+        from babel import support
+
+        return globals().setdefault("active_translation", support.Translations())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ---------------------------
 # Core dynamic translation API
 # ---------------------------
@@ -50,12 +63,7 @@ def _get_translator_for_domain(domain: str) -> support.NullTranslations:
     return REGISTRY.get_domain_translations(domain)
 
 
-def _resolve_domain_for_call() -> str:
-    mod_name = get_calling_module_name()
-    if not mod_name:
-        domain = REGISTRY.get_default_domain() or infer_domain_from_module("i18n_core")
-        logger.debug("i18n: resolve domain: no caller, using %s", domain)
-        return domain
+def _resolve_domain_for_module(mod_name: str) -> str:
     # explicit mapping?
     mapped = REGISTRY.get_module_domain(mod_name)
     if mapped:
@@ -74,6 +82,27 @@ def _resolve_domain_for_call() -> str:
     return domain or (REGISTRY.get_default_domain() or infer_domain_from_module(mod_name))
 
 
+def _resolve_domain_for_call() -> str:
+    frame = get_calling_frame()
+    if frame is None:
+        domain = REGISTRY.get_default_domain() or infer_domain_from_module("i18n_core")
+        logger.debug("i18n: resolve domain: no caller, using %s", domain)
+        return domain
+    # Fast path: this call site was resolved before and the mapping is unchanged
+    code = frame.f_code
+    domain = REGISTRY.domain_for_code(code)
+    if domain is not None:
+        return domain
+    stats = REGISTRY._stats
+    start = time.perf_counter() if stats is not None else 0.0
+    generation = REGISTRY.generation
+    domain = _resolve_domain_for_module(frame.f_globals["__name__"])
+    REGISTRY.remember_code_domain(code, domain, generation)
+    if stats is not None:
+        stats.record_resolution(time.perf_counter() - start)
+    return domain
+
+
 def _dynamic_gettext(message: str) -> str:
     domain = _resolve_domain_for_call()
     t = _get_translator_for_domain(domain)
@@ -81,7 +110,11 @@ def _dynamic_gettext(message: str) -> str:
     gettext_func = getattr(t, "gettext", getattr(t, "ugettext", None))
     if gettext_func is None:
         return message
-    return gettext_func(message)
+    result = gettext_func(message)
+    if result is message:
+        # Catalogs hand back the msgid object itself when nothing matched
+        REGISTRY.record_missing(domain, message)
+    return result
 
 
 def _dynamic_ngettext(singular: str, plural: str, n: int) -> str:
@@ -90,15 +123,202 @@ def _dynamic_ngettext(singular: str, plural: str, n: int) -> str:
     ngettext_func = getattr(t, "ngettext", getattr(t, "ungettext", None))
     if ngettext_func is None:
         return singular if n == 1 else plural
-    return ngettext_func(singular, plural, n)
+    result = ngettext_func(singular, plural, n)
+    if result is singular or result is plural:
+        REGISTRY.record_missing(domain, singular)
+    return result
 
 
-def _dynamic_lazy_gettext(message: str) -> support.LazyProxy:
-    try:
-        return support.LazyProxy(lambda: _dynamic_gettext(message), enable_cache=False)  # type: ignore[call-arg]
-    except TypeError:
-        # Older Babel without enable_cache
-        return support.LazyProxy(lambda: _dynamic_gettext(message))
+def _dynamic_lazy_gettext(message: str) -> LazyString:
+    # Remember the creating module; its domain is resolved when the string is used
+    frame = get_calling_frame()
+    return LazyString(message, module=frame.f_globals["__name__"] if frame is not None else None)
+
+
+# Module-level aliases so libraries can ``from i18n_core import _``
+_ = _dynamic_gettext
+__ = _dynamic_lazy_gettext
+ngettext = _dynamic_ngettext
+
+
+# ---------------------------
+# Batch translation API
+# ---------------------------
+
+def _batch_translator(domain: Optional[str]) -> support.NullTranslations:
+    # Resolve the caller's domain and the catalog once for the whole batch
+    return _get_translator_for_domain(domain or _resolve_domain_for_call())
+
+
+def gettext_many(msgids: Iterable[str], domain: Optional[str] = None) -> List[str]:
+    """Translate many messages with a single domain and catalog lookup.
+
+    `domain` defaults to the calling module's domain, as for ``_()``.
+    """
+    gettext_func = _batch_translator(domain).gettext
+    return [gettext_func(msg) for msg in msgids]
+
+
+def ngettext_many(
+    pairs: Iterable[Tuple[str, str]], counts: Iterable[int], domain: Optional[str] = None
+) -> List[str]:
+    """Plural-aware counterpart of `gettext_many`; `pairs` and `counts` must have equal length."""
+    pairs = list(pairs)
+    counts = list(counts)
+    if len(pairs) != len(counts):
+        raise ValueError(f"got {len(pairs)} message pairs but {len(counts)} counts")
+    ngettext_func = _batch_translator(domain).ngettext
+    return [ngettext_func(s1, s2, n) for (s1, s2), n in zip(pairs, counts)]
+
+
+def ngettext_array(singular: str, plural: str, counts: Iterable[int], domain: Optional[str] = None) -> List[str]:
+    """Translate one plural message for every count in `counts`.
+
+    The catalog's plural rule is evaluated once per distinct count (using
+    NumPy when installed, so `counts` may be an array) and the message is
+    looked up once per plural form, not once per count.
+    """
+    if domain is None:
+        domain = _resolve_domain_for_call()
+    translator = _get_translator_for_domain(domain)
+    if not hasattr(counts, "__getitem__"):
+        counts = list(counts)
+    indices = plurals.plural_indices(getattr(translator, "plural", plurals.germanic_plural), counts)
+    # Untranslated messages fall back on n == 1 rather than on the plural form
+    # (e.g. fr maps 0 and 1 to one form), so that is part of the key
+    keys = [(index, bool(counts[position] == 1)) for position, index in enumerate(indices)]  # type: ignore[index]
+    forms: Dict[Tuple[int, bool], str] = {}
+    for position, key in enumerate(keys):
+        if key in forms:
+            continue
+        # First count with this plural form stands in for all of them
+        result = translator.ngettext(singular, plural, int(counts[position]))  # type: ignore[index]
+        if result is singular or result is plural:
+            REGISTRY.record_missing(domain, singular)
+        forms[key] = result
+    return [forms[key] for key in keys]
+
+
+def iter_gettext(msgids: Iterable[str], domain: Optional[str] = None) -> Iterator[str]:
+    """Lazily translate a stream of messages.
+
+    The domain and catalog (including any ``use_locale`` override) are fixed
+    when this is called, not when the iterator is consumed.
+    """
+    gettext_func = _batch_translator(domain).gettext
+    return (gettext_func(msg) for msg in msgids)
+
+
+def translate_records(
+    records: Iterable[Mapping[str, Any]], fields: Sequence[str], domain: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield a copy of each record with the string values in `fields` translated."""
+    gettext_func = _batch_translator(domain).gettext
+
+    def _translate() -> Iterator[Dict[str, Any]]:
+        for record in records:
+            row = dict(record)
+            for field in fields:
+                value = row.get(field)
+                if isinstance(value, str):
+                    row[field] = gettext_func(value)
+            yield row
+
+    return _translate()
+
+
+class _DomainBinding:
+    """The current catalog's bound ``gettext``/``ngettext`` for one domain.
+
+    Module wrappers with an explicit domain call these attributes directly,
+    skipping domain resolution and the registry. Locale and provider changes
+    swap them back to resolving stubs; the next call rebinds.
+    """
+
+    __slots__ = ("domain", "gettext", "ngettext", "_version", "_lock")
+
+    def __init__(self, domain: str) -> None:
+        self.domain = domain
+        self._version = 0
+        self._lock = threading.Lock()
+        self.gettext: Callable[[str], str] = self._bind_gettext
+        self.ngettext: Callable[[str, str, int], str] = self._bind_ngettext
+
+    def reset(self) -> None:
+        with self._lock:
+            self._version += 1
+            self.gettext = self._bind_gettext
+            self.ngettext = self._bind_ngettext
+
+    def _bind(self) -> Tuple[Callable[[str], str], Callable[[str, str, int], str]]:
+        version = self._version
+        t = _get_translator_for_domain(self.domain)
+        gf = getattr(t, "gettext", getattr(t, "ugettext", None)) or (lambda msg: msg)
+        ngf = getattr(t, "ngettext", getattr(t, "ungettext", None)) or (lambda s1, s2, n: s1 if n == 1 else s2)
+        if REGISTRY._stats is not None:
+            gf, ngf = self._counting(gf, ngf)
+        with self._lock:
+            # A reset during the lookup means `t` may be stale; keep the stubs
+            if version == self._version:
+                self.gettext = gf
+                self.ngettext = ngf
+        return gf, ngf
+
+    def _counting(
+        self, gf: Callable[[str], str], ngf: Callable[[str, str, int], str]
+    ) -> Tuple[Callable[[str], str], Callable[[str, str, int], str]]:
+        # Only installed while metrics are on; enable_stats() resets bindings
+        domain = self.domain
+
+        def counting_gettext(msg: str) -> str:
+            result = gf(msg)
+            if result is msg:
+                REGISTRY.record_missing(domain, msg)
+            return result
+
+        def counting_ngettext(s1: str, s2: str, n: int) -> str:
+            result = ngf(s1, s2, n)
+            if result is s1 or result is s2:
+                REGISTRY.record_missing(domain, s1)
+            return result
+
+        return counting_gettext, counting_ngettext
+
+    def _bind_gettext(self, msg: str) -> str:
+        return self._bind()[0](msg)
+
+    def _bind_ngettext(self, s1: str, s2: str, n: int) -> str:
+        return self._bind()[1](s1, s2, n)
+
+
+_bindings: Dict[str, _DomainBinding] = {}
+_bindings_lock = threading.Lock()
+
+
+def _binding_for_domain(domain: str) -> _DomainBinding:
+    binding = _bindings.get(domain)
+    if binding is None:
+        with _bindings_lock:
+            binding = _bindings.setdefault(domain, _DomainBinding(domain))
+    return binding
+
+
+def _reset_bindings_for_locale(locale_id: str) -> None:
+    for binding in list(_bindings.values()):
+        binding.reset()
+
+
+def _reset_bindings_for_domain(domain: Optional[str]) -> None:
+    if domain is None:
+        _reset_bindings_for_locale("")
+        return
+    binding = _bindings.get(domain)
+    if binding is not None:
+        binding.reset()
+
+
+REGISTRY.on_locale_change(_reset_bindings_for_locale)
+REGISTRY.on_domain_change(_reset_bindings_for_domain)
 
 
 def install_translation_into_module(module: ModuleType = builtins, domain: Optional[str] = None) -> None:
@@ -109,7 +329,7 @@ def install_translation_into_module(module: ModuleType = builtins, domain: Optio
     """
 
     bound_domain = domain
-    if bound_domain is None:
+    if bound_domain is None and module is not builtins:
         # infer from given module
         mod_name = getattr(module, "__name__", None)
         if mod_name:
@@ -119,23 +339,28 @@ def install_translation_into_module(module: ModuleType = builtins, domain: Optio
             ensure_inferred_provider(mod_name, mod_file)
     logger.debug("i18n: installing wrappers into module=%s domain=%s", getattr(module, "__name__", None), bound_domain)
 
-    def _mod_gettext(msg: str) -> str:
-        d = bound_domain or _resolve_domain_for_call()
-        t = _get_translator_for_domain(d)
-        gf = getattr(t, "gettext", getattr(t, "ugettext", None))
-        return gf(msg) if gf else msg
+    if bound_domain:
+        # Pre-bound: a single attribute load away from the catalog's own methods
+        binding = _binding_for_domain(bound_domain)
 
-    def _mod_ngettext(s1: str, s2: str, n: int) -> str:
-        d = bound_domain or _resolve_domain_for_call()
-        t = _get_translator_for_domain(d)
-        ngf = getattr(t, "ngettext", getattr(t, "ungettext", None))
-        return ngf(s1, s2, n) if ngf else (s1 if n == 1 else s2)
+        has_context_locale = REGISTRY.has_context_locale
 
-    def _mod_lazy(msg: str) -> support.LazyProxy:
-        try:
-            return support.LazyProxy(lambda: _mod_gettext(msg), enable_cache=False)  # type: ignore[call-arg]
-        except TypeError:
-            return support.LazyProxy(lambda: _mod_gettext(msg))
+        def _mod_gettext(msg: str) -> str:
+            if not has_context_locale():
+                return binding.gettext(msg)
+            return _get_translator_for_domain(bound_domain).gettext(msg)
+
+        def _mod_ngettext(s1: str, s2: str, n: int) -> str:
+            if not has_context_locale():
+                return binding.ngettext(s1, s2, n)
+            return _get_translator_for_domain(bound_domain).ngettext(s1, s2, n)
+
+        def _mod_lazy(msg: str) -> LazyString:
+            return LazyString(msg, domain=bound_domain)
+
+    else:
+        # Builtins without an explicit domain: resolve the caller's domain per call
+        _mod_gettext, _mod_ngettext, _mod_lazy = _dynamic_gettext, _dynamic_ngettext, _dynamic_lazy_gettext
 
     module._ = _mod_gettext
     module.__ = _mod_lazy
@@ -147,7 +372,9 @@ MAC_LOCALES = {"0:0": "en_GB.utf-8", "0:3": "de_DE.utf-8"}
 
 def get_system_locale() -> str:
     """Attempts to return the current system locale as an LCID"""
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
+        import ctypes
+
         LCID = ctypes.windll.kernel32.GetUserDefaultLCID()
         try:
             return locale.windows_locale[LCID]
@@ -176,6 +403,12 @@ def get_locale_path(module: Optional[ModuleType] = None) -> str:
     Returns:
 
     """
+    if module is not None:
+        manifest_path = REGISTRY.manifest_locale_path(module.__name__)
+        if manifest_path is not None:
+            return manifest_path
+    from platform_utils import paths
+
     if not paths.is_frozen():
         return os.path.join(os.path.split(module.__file__)[0], "locale")
     return os.path.join(paths.embedded_data_path(), "locale")
@@ -191,9 +424,18 @@ def locale_decode(s: Any) -> str:
 
     """
     encoding = locale.getlocale()[1]
-    if encoding is not None:
+    if encoding is not None and isinstance(s, bytes):
         s = s.decode(encoding)
     return s  # type: ignore[return-value]
+
+
+def use_locale(locale_id: str, languages: Optional[Iterable[str]] = None) -> _LocaleOverride:
+    """Translate in `locale_id` within a ``with``/``async with`` block.
+
+    Only the current thread or asyncio task is affected; the process locale,
+    ``CURRENT_LOCALE`` and locale-change listeners are left alone.
+    """
+    return REGISTRY.use_locale(locale_id, languages=languages)
 
 
 def set_locale(locale_id: str) -> str:
@@ -215,7 +457,9 @@ def set_locale(locale_id: str) -> str:
         current_locale = locale.setlocale(locale.LC_ALL, "")
         logger.warning("Set to default locale %s", current_locale)
     # Set the windows locale for this thread to this locale.
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
+        import ctypes
+
         LCID = find_windows_LCID(locale_id)
         try:
             ctypes.windll.kernel32.SetThreadLocale(LCID)
@@ -231,6 +475,21 @@ def set_locale(locale_id: str) -> str:
     return resolved
 
 
+async def aset_locale(locale_id: str) -> str:
+    """Awaitable `set_locale` that does not block the event loop on catalog I/O.
+
+    Catalogs of the domains in use are loaded for the new locale in an
+    executor first (concurrent loads of the same catalog are shared); the
+    switch itself happens once they are cached, so lookups never wait.
+    """
+    domains = set(REGISTRY.cached_domains())
+    default_domain = REGISTRY.get_default_domain()
+    if default_domain:
+        domains.add(default_domain)
+    await REGISTRY.apreload(domains, locales=[locale_id])
+    return set_locale(locale_id)
+
+
 def find_windows_LCID(locale_id: str) -> int:
     """
     Find the windows LCID for the given locale identifier
@@ -241,6 +500,8 @@ def find_windows_LCID(locale_id: str) -> int:
     Returns:
 
     """
+    import ctypes
+
     # Windows > Vista is able to convert locale names to LCIDs
     func_LocaleNameToLCID = getattr(ctypes.windll.kernel32, "LocaleNameToLCID", None)
     if func_LocaleNameToLCID is not None:
@@ -259,7 +520,10 @@ def find_windows_LCID(locale_id: str) -> int:
 
 
 def locale_from_locale_id(locale_id: str) -> babel.core.Locale:
-    """
+    """Return the shared Babel Locale for a locale id such as ``de_DE``.
+
+    Locales are interned (see `i18n_core.locale_pool`); unknown ids raise
+    ``babel.core.UnknownLocaleError``, also on repeated calls.
 
     Args:
       locale_id:
@@ -267,10 +531,9 @@ def locale_from_locale_id(locale_id: str) -> babel.core.Locale:
     Returns:
 
     """
-    language, region = locale_id, None
-    if "_" in locale_id:
-        language, region = locale_id.split("_")
-    return babel.core.Locale(language, region)
+    from . import locale_pool
+
+    return locale_pool.get(locale_id)
 
 
 def get_available_locales(domain: str, locale_path: Optional[str] = None) -> Iterable[babel.core.Locale]:
@@ -283,6 +546,8 @@ def get_available_locales(domain: str, locale_path: Optional[str] = None) -> Ite
     Returns:
 
     """
+    import babel.core
+
     translations = get_available_translations(domain, locale_path)
     for translation_dir in translations:
         try:
@@ -317,35 +582,56 @@ def get_available_translations(domain: str, locale_path: Optional[str] = None) -
             paths_to_scan.append(application_locale_path)
     seen = set()
     for base in paths_to_scan:
-        if not base or not os.path.isdir(base):
-            continue
-        try:
-            dirs = os.listdir(base)
-        except OSError:
+        if not base:
             continue
-        for directory in dirs:
+        for directory in locale_index.get_index(os.fspath(base)).locales_for(domain):
             if directory in seen:
                 continue
-            lc_dir = os.path.join(base, directory, "LC_MESSAGES", f"{domain}.mo")
-            lc_dir_lower = os.path.join(base, directory, "lc_messages", f"{domain}.mo")
-            if os.path.exists(lc_dir) or os.path.exists(lc_dir_lower):
-                seen.add(directory)
-                logger.debug("i18n: found available translation: domain=%s locale=%s in %s", domain, directory, base)
-                yield directory
+            seen.add(directory)
+            logger.debug("i18n: found available translation: domain=%s locale=%s in %s", domain, directory, base)
+            yield directory
     # Always include a default fallback
     if DEFAULT_LOCALE not in seen:
         yield DEFAULT_LOCALE
 
 
 def format_timestamp(timestamp: Any) -> str:
-    """
+    """Format a timestamp or datetime for the active locale.
+
+    Today's timestamps are shown as a time, older ones as date and time,
+    using the locale's CLDR "medium" patterns (cached per locale).
 
     Args:
-      timestamp:
+      timestamp: POSIX timestamp or naive local datetime
 
     Returns:
+      The formatted string
+    """
+    from .formatting import get_timestamp_formatter
 
+    formatter = get_timestamp_formatter()
+    if formatter is None:
+        return _format_timestamp_c_locale(timestamp)
+    return formatter.format(timestamp)
+
+
+def format_timestamps(timestamps: Iterable[Any]) -> List[str]:
+    """Format a sequence of timestamps like `format_timestamp`.
+
+    The formatter and the "today" boundary are looked up once for the batch.
     """
+    from .formatting import get_timestamp_formatter
+
+    formatter = get_timestamp_formatter()
+    if formatter is None:
+        return [_format_timestamp_c_locale(ts) for ts in timestamps]
+    return formatter.format_many(timestamps)
+
+
+def _format_timestamp_c_locale(timestamp: Any) -> str:
+    # Fallback for locales without CLDR data: the process C locale
+    import datetime
+
     dt = timestamp
     if not isinstance(dt, datetime.datetime):
         dt = datetime.datetime.fromtimestamp(timestamp)
@@ -365,9 +651,18 @@ def finalize_i18n(
     app_locale_path: Optional[str] = None,
     install_into_builtins: bool = True,
     priority: int = 100,
+    preload: bool = False,
+    manifest: Optional[str] = None,
 ) -> str:
+    if manifest is not None:
+        # Providers and locale indexes recorded at build time (python -m i18n_core.manifest)
+        REGISTRY.load_manifest(manifest)
     if app_domain and app_locale_path:
-        REGISTRY.register_domain(app_domain, app_locale_path, priority=priority, source="finalize_i18n")
+        registered = {os.path.abspath(p.path) for p in REGISTRY.providers_for(app_domain)}
+        # A manifest may already list it; registering again would merge its catalogs
+        # twice and replace the seeded locale index with a fresh scan
+        if os.path.abspath(app_locale_path) not in registered:
+            REGISTRY.register_domain(app_domain, app_locale_path, priority=priority, source="finalize_i18n")
         REGISTRY.set_default_domain(app_domain)
         global application_locale_path
         application_locale_path = app_locale_path
@@ -377,6 +672,9 @@ def finalize_i18n(
     final_locale = locale_id or get_system_locale()
     REGISTRY.set_locale(final_locale, languages=languages)
     set_locale(final_locale)
+    if preload:
+        # Load every registered domain for the new locale in parallel now
+        REGISTRY.preload()
     logger.info("Activated i18n for domain=%s locale=%s", app_domain, final_locale)
     return final_locale
 
@@ -445,6 +743,6 @@ def install_module_translation(
     return None
 
 
-# Install dynamic builtins by default on import
+# Install dynamic builtins by default on import; the registry already starts
+# out on DEFAULT_LOCALE, so no set_locale() (and no listener calls) here
 install_translation_into_module(builtins)
-REGISTRY.set_locale(CURRENT_LOCALE)
@@ -0,0 +1,110 @@
+"""Persistent cache of merged translation catalogs.
+
+Each entry holds the final merged catalog for one (domain, chain, provider
+set) in a single marshal file, so later startups read one file instead of
+parsing and merging every provider's ``.mo``. Entries record the path,
+mtime and size of every source file and are ignored once any of them
+changes. All I/O errors are swallowed: an unwritable or corrupt cache only
+costs a normal load.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import re
+import tempfile
+from logging import getLogger
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+from babel import support
+
+from . import plurals
+
+logger = getLogger("i18n_core.diskcache")
+
+# Bump when the stored layout changes
+FORMAT_VERSION = 1
+
+Stamp = Tuple[str, int, int]
+
+
+def source_stamps(files: Iterable[str]) -> Optional[Tuple[Stamp, ...]]:
+    """Return (path, mtime_ns, size) for each file, or None if one is missing."""
+    stamps = []
+    for path in files:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamps.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+def file_label(domain: str) -> str:
+    """Readable, path-safe filename prefix for `domain` (the full key is hashed separately)."""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", domain)[:64]
+
+
+def entry_path(cache_dir: str, domain: str, chain: Sequence[str], providers: Iterable[Tuple[str, int]]) -> str:
+    key = repr((domain, tuple(chain), tuple(providers))).encode("utf-8")
+    digest = hashlib.sha1(key).hexdigest()
+    return os.path.join(cache_dir, f"{file_label(domain)}-{digest[:16]}.i18ncache")
+
+
+def load(path: str, stamps: Tuple[Stamp, ...], domain: str) -> Optional[support.Translations]:
+    """Load a cached catalog if it was built from exactly `stamps`."""
+    try:
+        with open(path, "rb") as fp:
+            data = marshal.load(fp)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError):
+        logger.debug("i18n: unreadable catalog cache entry: %s", path)
+        return None
+    if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION or data.get("stamps") != stamps:
+        return None
+    t = support.Translations(domain=domain)
+    t._catalog = data["catalog"]
+    t._info = data["info"]
+    t._charset = data["charset"]
+    t.files = list(data["files"])
+    plural_forms = t._info.get("plural-forms")
+    if plural_forms:
+        t.plural = plurals.evaluator(plural_forms)
+    return t
+
+
+def store(path: str, stamps: Tuple[Stamp, ...], translations: support.NullTranslations) -> bool:
+    """Write `translations` to the cache; returns False if it could not be stored."""
+    if not isinstance(translations, support.Translations) or translations._domains:
+        # Only plain merged catalogs round-trip through marshal
+        return False
+    data: Any = {
+        "version": FORMAT_VERSION,
+        "stamps": stamps,
+        "catalog": translations._catalog,
+        "info": translations._info,
+        "charset": translations._charset,
+        "files": list(translations.files),
+    }
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError as exc:
+        logger.debug("i18n: catalog cache not writable: %s (%s)", directory, exc)
+        return False
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            marshal.dump(data, fp)
+        os.replace(tmp, path)
+    except (OSError, ValueError) as exc:
+        logger.debug("i18n: failed to write catalog cache entry %s (%s)", path, exc)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    return True
@@ -0,0 +1,90 @@
+"""Locale-aware timestamp formatting with per-locale cached patterns.
+
+Formatters are built from Babel's CLDR patterns for the active i18n locale
+(not the process C locale), parsed once per locale and dropped whenever the
+registry locale changes.
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, Optional
+
+from .registry import REGISTRY
+
+logger = getLogger("i18n_core.formatting")
+
+
+class TimestampFormatter:
+    """Formats timestamps as a time for today and as a date and time otherwise.
+
+    Matches the old ``%X`` / ``%c`` split using the CLDR "medium" time and
+    datetime patterns of `locale_id`.
+    """
+
+    def __init__(self, locale_id: str) -> None:
+        from babel.dates import parse_pattern
+
+        from . import locale_from_locale_id
+
+        self.locale_id = locale_id
+        self.locale = locale_from_locale_id(locale_id)
+        time_pattern = self.locale.time_formats["medium"].pattern
+        date_pattern = self.locale.date_formats["medium"].pattern
+        # Combine into one pattern so a datetime is formatted in a single pass
+        combined = self.locale.datetime_formats["medium"].replace("{0}", time_pattern).replace("{1}", date_pattern)
+        self._time = parse_pattern(time_pattern)
+        self._datetime = parse_pattern(combined)
+
+    def format(self, timestamp: Any, today: Optional[datetime.date] = None) -> str:
+        dt = timestamp if isinstance(timestamp, datetime.datetime) else datetime.datetime.fromtimestamp(timestamp)
+        if today is None:
+            today = datetime.date.today()
+        pattern = self._time if dt.date() == today else self._datetime
+        return pattern.apply(dt, self.locale)
+
+    def format_many(self, timestamps: Iterable[Any]) -> List[str]:
+        today = datetime.date.today()
+        fmt = self.format
+        return [fmt(ts, today) for ts in timestamps]
+
+
+_formatters: Dict[str, Optional[TimestampFormatter]] = {}
+_lock = threading.Lock()
+_subscribed = False
+_MISSING = object()
+
+
+def _clear(_locale_id: Any = None) -> None:
+    _formatters.clear()
+
+
+def get_timestamp_formatter(locale_id: Optional[str] = None) -> Optional[TimestampFormatter]:
+    """Return the cached formatter for `locale_id` (default: the active locale).
+
+    Returns None when Babel has no data for the locale.
+    """
+    global _subscribed
+    if locale_id is None:
+        locale_id = REGISTRY.get_locale()
+    cached = _formatters.get(locale_id, _MISSING)
+    if cached is not _MISSING:
+        return cached  # type: ignore[return-value]
+    with _lock:
+        if not _subscribed:
+            REGISTRY.on_locale_change(_clear)
+            _subscribed = True
+        cached = _formatters.get(locale_id, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+        from babel.core import UnknownLocaleError
+
+        try:
+            formatter: Optional[TimestampFormatter] = TimestampFormatter(locale_id)
+        except (UnknownLocaleError, ValueError) as exc:
+            logger.debug("i18n: no CLDR patterns for %s (%s)", locale_id, exc)
+            formatter = None
+        _formatters[locale_id] = formatter
+        return formatter
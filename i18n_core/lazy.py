@@ -0,0 +1,135 @@
+"""Lazily translated strings."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional, Tuple
+
+from .registry import REGISTRY
+
+
+class LazyString:
+    """A message translated on use and cached until the registry changes.
+
+    The translation is looked up in `domain` when given, otherwise in the
+    domain resolved for `module` (the module that created the string). The
+    cached value is reused until ``REGISTRY.generation`` moves on, i.e. after
+    a locale switch or a provider/mapping change, or until it is used under a
+    different context locale (see ``use_locale``).
+    """
+
+    __slots__ = ("_msgid", "_domain", "_module", "_cached")
+
+    def __init__(self, msgid: str, domain: Optional[str] = None, module: Optional[str] = None) -> None:
+        self._msgid = msgid
+        self._domain = domain
+        self._module = module
+        # (generation, chain, value), replaced as a whole so threads using
+        # different context locales never see each other's half-written entry
+        self._cached: Optional[Tuple[int, Tuple[str, ...], str]] = None
+
+    @property
+    def msgid(self) -> str:
+        return self._msgid
+
+    @property
+    def value(self) -> str:
+        generation = REGISTRY._generation
+        chain = REGISTRY.active_chain()
+        cached = self._cached
+        if cached is not None and cached[0] == generation and cached[1] == chain:
+            return cached[2]
+        value = self._translate()
+        self._cached = (generation, chain, value)
+        return value
+
+    def _translate(self) -> str:
+        domain = self._domain
+        if domain is None:
+            from . import _resolve_domain_for_module, infer_domain_from_module
+
+            if self._module:
+                domain = _resolve_domain_for_module(self._module)
+            else:
+                domain = REGISTRY.get_default_domain() or infer_domain_from_module("i18n_core")
+        t = REGISTRY.get_domain_translations(domain)
+        gettext_func = getattr(t, "gettext", getattr(t, "ugettext", None))
+        if gettext_func is None:
+            return self._msgid
+        result = gettext_func(self._msgid)
+        if result is self._msgid:
+            REGISTRY.record_missing(domain, self._msgid)
+        return result
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.value!r}>"
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate str methods (upper, format, split, ...) to the translation
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.value)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.value
+
+    def __getitem__(self, key: Any) -> str:
+        return self.value[key]
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return self.value == other
+
+    def __ne__(self, other: object) -> bool:
+        return self.value != other
+
+    def __lt__(self, other: Any) -> bool:
+        return self.value < other
+
+    def __le__(self, other: Any) -> bool:
+        return self.value <= other
+
+    def __gt__(self, other: Any) -> bool:
+        return self.value > other
+
+    def __ge__(self, other: Any) -> bool:
+        return self.value >= other
+
+    def __add__(self, other: Any) -> str:
+        return self.value + other
+
+    def __radd__(self, other: Any) -> str:
+        return other + self.value
+
+    def __mul__(self, other: Any) -> str:
+        return self.value * other
+
+    __rmul__ = __mul__
+
+    def __mod__(self, other: Any) -> str:
+        return self.value % other
+
+    def __rmod__(self, other: Any) -> str:
+        return other % self.value
+
+    def __getstate__(self) -> Any:
+        return (self._msgid, self._domain, self._module)
+
+    def __setstate__(self, state: Any) -> None:
+        self.__init__(*state)  # type: ignore[misc]
@@ -0,0 +1,180 @@
+"""Cached index of the ``.mo`` files under a locale directory.
+
+A provider path such as ``<pkg>/locale`` is scanned once with ``os.scandir``
+into ``{locale: {domain: mo_path}}``. Lookups, including misses, are then
+answered from memory. The index is revalidated against the mtimes of the
+scanned directories at most every `REVALIDATE_INTERVAL` seconds, and can be
+dropped explicitly with `invalidate`.
+"""
+
+from __future__ import annotations
+
+import gettext
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from logging import getLogger
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = getLogger("i18n_core.locale_index")
+
+# Seconds between mtime checks of an index
+REVALIDATE_INTERVAL = 2.0
+
+# gettext only loads from LC_MESSAGES; the lowercase spelling some packages
+# ship is listed by get_available_translations() but never loaded
+_MESSAGES_DIR = "LC_MESSAGES"
+_LISTED_ONLY_DIR = "lc_messages"
+
+# gettext.find() goes through os.path.exists(), which matches "pt_br/" for
+# "pt_BR" on these platforms' default filesystems
+_CASE_INSENSITIVE = sys.platform in ("win32", "darwin")
+
+
+@lru_cache(maxsize=256)
+def _expand_lang(lang: str) -> Tuple[str, ...]:
+    # Same candidate order as gettext.find()
+    return tuple(gettext._expand_lang(lang))  # type: ignore[attr-defined]
+
+
+class LocaleDirIndex:
+    """Snapshot of ``<path>/<locale>/LC_MESSAGES/<domain>.mo`` files."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.catalogs: Dict[str, Dict[str, str]] = {}
+        # Locale -> domains found only under lc_messages/
+        self._listed: Dict[str, Set[str]] = {}
+        # (locale, domain) casefolded -> mo path, for case-insensitive lookups
+        self._folded: Dict[Tuple[str, str], str] = {}
+        # Directory -> mtime_ns at scan time (None: did not exist)
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self._checked = 0.0
+        self._scan()
+
+    @classmethod
+    def from_catalogs(cls, path: str, catalogs: Dict[str, Dict[str, str]]) -> "LocaleDirIndex":
+        """Index of known files (e.g. from a build manifest); never rescanned."""
+        index = cls.__new__(cls)
+        index.path = path
+        index.catalogs = catalogs
+        index._listed = {}
+        index._folded = _fold(catalogs) if _CASE_INSENSITIVE else {}
+        index._mtimes = {}
+        index._checked = time.monotonic()
+        return index
+
+    def _scan(self) -> None:
+        catalogs: Dict[str, Dict[str, str]] = {}
+        listed: Dict[str, Set[str]] = {}
+        mtimes: Dict[str, Optional[int]] = {self.path: _mtime(self.path)}
+        if mtimes[self.path] is not None:
+            try:
+                with os.scandir(self.path) as it:
+                    locale_dirs = [entry for entry in it if entry.is_dir()]
+            except OSError:
+                locale_dirs = []
+            for entry in locale_dirs:
+                mtimes[entry.path] = _mtime(entry.path)
+                domains = _scan_messages(os.path.join(entry.path, _MESSAGES_DIR), mtimes)
+                if domains:
+                    catalogs[entry.name] = domains
+                extra = _scan_messages(os.path.join(entry.path, _LISTED_ONLY_DIR), mtimes)
+                if extra:
+                    listed[entry.name] = set(extra)
+        self.catalogs = catalogs
+        self._listed = listed
+        self._folded = _fold(catalogs) if _CASE_INSENSITIVE else {}
+        self._mtimes = mtimes
+        self._checked = time.monotonic()
+        logger.debug("i18n: indexed %s: %d locales", self.path, len(catalogs))
+
+    def revalidate(self, force: bool = False) -> None:
+        """Rescan if any indexed directory changed since the last scan."""
+        now = time.monotonic()
+        if not force and now - self._checked < REVALIDATE_INTERVAL:
+            return
+        self._checked = now
+        if any(_mtime(d) != m for d, m in self._mtimes.items()):
+            self._scan()
+
+    def find(self, domain: str, languages: Iterable[str]) -> Optional[str]:
+        """Return the .mo file gettext.find() would pick, without touching the disk."""
+        for lang in languages:
+            for candidate in _expand_lang(lang):
+                if candidate == "C":
+                    return None
+                path = self.catalogs.get(candidate, {}).get(domain)
+                if path is None and _CASE_INSENSITIVE:
+                    path = self._folded.get((candidate.lower(), domain.lower()))
+                if path is not None:
+                    return path
+        return None
+
+    def locales_for(self, domain: str) -> List[str]:
+        """Locales with a catalog for `domain`, including lc_messages-only ones."""
+        locales = [loc for loc, domains in self.catalogs.items() if domain in domains]
+        locales.extend(loc for loc, domains in self._listed.items() if domain in domains and loc not in locales)
+        return locales
+
+
+def _scan_messages(messages_dir: str, mtimes: Dict[str, Optional[int]]) -> Dict[str, str]:
+    domains: Dict[str, str] = {}
+    try:
+        with os.scandir(messages_dir) as it:
+            for mo in it:
+                if mo.name.endswith(".mo") and mo.is_file():
+                    domains[mo.name[:-3]] = mo.path
+    except OSError:
+        return domains
+    mtimes[messages_dir] = _mtime(messages_dir)
+    return domains
+
+
+def _fold(catalogs: Dict[str, Dict[str, str]]) -> Dict[Tuple[str, str], str]:
+    folded: Dict[Tuple[str, str], str] = {}
+    for loc, domains in catalogs.items():
+        for domain, path in domains.items():
+            folded.setdefault((loc.lower(), domain.lower()), path)
+    return folded
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+_indexes: Dict[str, LocaleDirIndex] = {}
+_lock = threading.Lock()
+
+
+def get_index(path: str) -> LocaleDirIndex:
+    """Return the (revalidated) index for a locale directory."""
+    index = _indexes.get(path)
+    if index is None:
+        with _lock:
+            index = _indexes.get(path)
+            if index is None:
+                index = _indexes[path] = LocaleDirIndex(path)
+        return index
+    index.revalidate()
+    return index
+
+
+def seed(index: LocaleDirIndex) -> None:
+    """Use `index` for its path instead of scanning the directory."""
+    with _lock:
+        _indexes[index.path] = index
+
+
+def invalidate(path: Optional[str] = None) -> None:
+    """Drop the index for `path`, or every index when `path` is None."""
+    with _lock:
+        if path is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(path, None)
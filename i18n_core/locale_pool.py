@@ -0,0 +1,66 @@
+"""Interned ``babel.core.Locale`` objects.
+
+`get` returns one shared Locale per normalized id, so repeated lookups (for
+example listing the available locales of a domain) neither re-check the
+CLDR data files nor reload data another caller already touched. Babel loads
+a Locale's CLDR data (display names, patterns, ...) on first attribute
+access, so creating pool entries stays cheap. Unknown ids are cached too.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Union
+
+from .registry import _normalize_lang
+
+if TYPE_CHECKING:
+    import babel.core
+
+# Distinct locale ids kept, least recently used evicted first
+LOCALE_POOL_SIZE = 256
+
+_pool: "OrderedDict[str, Union[babel.core.Locale, None]]" = OrderedDict()
+_lock = threading.Lock()
+_MISSING = object()
+
+
+def get(locale_id: str) -> babel.core.Locale:
+    """Return the interned Locale for `locale_id` ("de", "de_DE", "de-de", ...).
+
+    Raises ``babel.core.UnknownLocaleError`` (also for ids that failed before).
+    """
+    key = _normalize_lang(locale_id) or locale_id
+    locale = _pool.get(key, _MISSING)
+    if locale is not _MISSING:
+        try:
+            _pool.move_to_end(key)
+        except KeyError:  # evicted by another thread meanwhile
+            pass
+        if locale is not None:
+            return locale  # type: ignore[return-value]
+    import babel.core
+
+    if locale is None:
+        raise babel.core.UnknownLocaleError(key)
+    try:
+        # Without likely subtags, so str(locale) is still the directory id
+        # (zh_CN would become zh_Hans_CN and miss the zh_CN catalogs)
+        locale = babel.core.Locale.parse(key, resolve_likely_subtags=False)
+    except (babel.core.UnknownLocaleError, ValueError):
+        locale = None
+    with _lock:
+        # Keep the instance another thread may have interned meanwhile
+        locale = _pool.setdefault(key, locale)
+        _pool.move_to_end(key)
+        while len(_pool) > LOCALE_POOL_SIZE:
+            _pool.popitem(last=False)
+    if locale is None:
+        raise babel.core.UnknownLocaleError(key)
+    return locale
+
+
+def clear() -> None:
+    with _lock:
+        _pool.clear()
@@ -0,0 +1,121 @@
+"""Build-time manifest of translation domains.
+
+A manifest records module prefix -> domain -> locale directories -> the
+``.mo`` file of each available locale, so an application (frozen builds in
+particular) can register every provider and its locale index from a single
+file read instead of probing ``<pkg>/locale`` directories at runtime. Load it
+with `_Registry.load_manifest`.
+
+Build one with::
+
+    python -m i18n_core.manifest i18n-manifest.json --app myapp=locale --package somelib
+
+Paths are stored relative to ``--base``, the directory the manifest will be
+loaded from (default: the output's directory), and resolved against the
+manifest's location when loaded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .locale_index import LocaleDirIndex
+from .registry import infer_domain_from_module
+
+# Bump when the layout changes
+FORMAT_VERSION = 1
+
+
+def package_dir(module_name: str) -> Optional[str]:
+    """Directory of a package or module, found without importing it."""
+    spec = importlib.util.find_spec(module_name)
+    if spec is None:
+        return None
+    if spec.submodule_search_locations:
+        return list(spec.submodule_search_locations)[0]
+    return os.path.dirname(spec.origin) if spec.origin else None
+
+
+def build(
+    packages: Iterable[str] = (),
+    app: Optional[Tuple[str, str]] = None,
+    base: str = ".",
+) -> Dict[str, Any]:
+    """Collect the manifest data for library `packages` and an optional (domain, locale_path) `app`."""
+    modules: Dict[str, str] = {}
+    providers: List[Tuple[str, str, int, str]] = []
+    if app is not None:
+        providers.append((app[0], app[1], 100, "manifest"))
+    for package in packages:
+        domain = infer_domain_from_module(package)
+        modules[package] = domain
+        directory = package_dir(package)
+        if directory is not None and os.path.isdir(os.path.join(directory, "locale")):
+            providers.append((domain, os.path.join(directory, "locale"), 50, package))
+    domains: Dict[str, List[Dict[str, Any]]] = {}
+    for domain, path, priority, source in providers:
+        index = LocaleDirIndex(path)
+        catalogs = {
+            loc: os.path.relpath(files[domain], base) for loc, files in sorted(index.catalogs.items()) if domain in files
+        }
+        domains.setdefault(domain, []).append(
+            {"path": os.path.relpath(path, base), "priority": priority, "source": source, "catalogs": catalogs}
+        )
+    return {
+        "version": FORMAT_VERSION,
+        "default_domain": app[0] if app is not None else None,
+        "modules": modules,
+        "domains": domains,
+    }
+
+
+def write(data: Dict[str, Any], output: str) -> None:
+    with open(output, "w", encoding="utf-8") as fp:
+        json.dump(data, fp, indent=1, sort_keys=True)
+        fp.write("\n")
+
+
+def read(path: str) -> Dict[str, Any]:
+    """Read a manifest and resolve its paths against the manifest's directory.
+
+    Raises OSError or ValueError for a missing, unreadable or incompatible file.
+    """
+    with open(path, "rb") as fp:
+        data = json.load(fp)
+    if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported i18n manifest: {path}")
+    root = os.path.dirname(os.path.abspath(path))
+    for entries in data["domains"].values():
+        for entry in entries:
+            entry["path"] = os.path.normpath(os.path.join(root, entry["path"]))
+            entry["catalogs"] = {
+                loc: os.path.normpath(os.path.join(root, mo)) for loc, mo in entry["catalogs"].items()
+            }
+    return data
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m i18n_core.manifest", description="Write an i18n domain manifest.")
+    parser.add_argument("output", help="manifest file to write")
+    parser.add_argument("--app", metavar="DOMAIN=PATH", help="application domain and its locale directory")
+    parser.add_argument("--package", action="append", default=[], help="library package with a <pkg>/locale directory")
+    parser.add_argument("--base", help="directory the manifest is loaded from at runtime (default: the output's directory)")
+    args = parser.parse_args(argv)
+    app = None
+    if args.app:
+        domain, sep, path = args.app.partition("=")
+        if not sep:
+            parser.error("--app expects DOMAIN=PATH")
+        app = (domain, os.path.abspath(path))
+    base = args.base or os.path.dirname(os.path.abspath(args.output))
+    data = build(args.package, app=app, base=base)
+    write(data, args.output)
+    print(f"{args.output}: {len(data['domains'])} domains, {len(data['modules'])} packages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Counters collected by the registry (see `_Registry.stats`).
+
+Updates are plain dict increments without locking: under heavy thread
+contention a few increments may be lost, which keeps the hot path cheap
+enough to leave collection on in production. Snapshots copy each container
+before reading it, retrying if a writer resized it mid-copy.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, DefaultDict, Dict, Set, Tuple, TypeVar
+
+T = TypeVar("T", dict, set)
+
+# Distinct untranslated msgids remembered per domain
+MAX_TRACKED_MISSING = 1000
+
+
+@dataclass(frozen=True)
+class LoadEvent:
+    """Passed to `_Registry.on_load` callbacks after a catalog was built."""
+
+    domain: str
+    chain: Tuple[str, ...]
+    files: Tuple[str, ...]
+    seconds: float
+    from_disk_cache: bool = False
+
+
+def _copy(container: T) -> T:
+    # Writers don't lock; a concurrent insert can make the copy raise
+    while True:
+        try:
+            return container.copy()
+        except RuntimeError:
+            continue
+
+
+class RegistryStats:
+    def __init__(self) -> None:
+        self.hits: DefaultDict[str, int] = defaultdict(int)
+        self.misses: DefaultDict[str, int] = defaultdict(int)
+        self.merge_seconds: DefaultDict[str, float] = defaultdict(float)
+        self.disk_cache_hits: DefaultDict[str, int] = defaultdict(int)
+        # (domain, provider path) -> count / seconds
+        self.loads: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self.load_seconds: DefaultDict[Tuple[str, str], float] = defaultdict(float)
+        self.resolutions = 0
+        self.resolution_seconds = 0.0
+        self.missing: DefaultDict[str, int] = defaultdict(int)
+        self.missing_msgids: DefaultDict[str, Set[str]] = defaultdict(set)
+
+    def record_load(self, domain: str, path: str, seconds: float) -> None:
+        key = (domain, path)
+        self.loads[key] += 1
+        self.load_seconds[key] += seconds
+
+    def record_resolution(self, seconds: float) -> None:
+        self.resolutions += 1
+        self.resolution_seconds += seconds
+
+    def record_missing(self, domain: str, msgid: str) -> None:
+        self.missing[domain] += 1
+        seen = self.missing_msgids[domain]
+        if len(seen) < MAX_TRACKED_MISSING:
+            seen.add(msgid)
+
+    def snapshot(self) -> Dict[str, Any]:
+        hits, misses, missing = _copy(self.hits), _copy(self.misses), _copy(self.missing)
+        merge_seconds, disk_cache_hits = _copy(self.merge_seconds), _copy(self.disk_cache_hits)
+        missing_msgids = _copy(self.missing_msgids)
+        loads, load_seconds = _copy(self.loads), _copy(self.load_seconds)
+        domains: Dict[str, Dict[str, Any]] = {}
+        for domain in sorted(set(hits) | set(misses) | set(merge_seconds) | set(missing)):
+            domains[domain] = {
+                "hits": hits.get(domain, 0),
+                "misses": misses.get(domain, 0),
+                "disk_cache_hits": disk_cache_hits.get(domain, 0),
+                "merge_seconds": merge_seconds.get(domain, 0.0),
+                "missing": missing.get(domain, 0),
+                "missing_msgids": sorted(_copy(missing_msgids.get(domain, set()))),
+            }
+        providers = [
+            {"domain": domain, "path": path, "loads": count, "load_seconds": load_seconds.get((domain, path), 0.0)}
+            for (domain, path), count in sorted(loads.items())
+        ]
+        return {
+            "domains": domains,
+            "providers": providers,
+            "resolution": {"count": self.resolutions, "seconds": self.resolution_seconds},
+        }
@@ -0,0 +1,347 @@
+"""Memory-mapped ``.mo`` catalogs.
+
+`MappedTranslations` answers lookups from the raw ``.mo`` bytes instead of
+parsing every entry into a dict up front: the GNU hash table is used when the
+file has one, otherwise a binary search over the sorted original strings.
+Translations are decoded only when they are requested.
+
+By default each process reads the whole file into a private anonymous
+mapping, so the file can be rewritten in place while loaded. That costs the
+file's size in RSS per process and gives up zero-copy page sharing; only
+``shared=True`` maps the file itself (see `MappedTranslations`).
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from logging import getLogger
+from typing import BinaryIO, Dict, List, Mapping, Optional, Tuple
+
+from babel import support
+
+from . import plurals
+
+logger = getLogger("i18n_core.mofile")
+
+LE_MAGIC = 0x950412DE
+BE_MAGIC = 0xDE120495
+CONTEXT_SEPARATOR = "\x04"
+
+
+def hashpjw(data: bytes) -> int:
+    """The ELF hash used by GNU gettext for ``.mo`` hash tables."""
+    h = 0
+    for c in data:
+        h = (h << 4) + c
+        g = h & 0xF0000000
+        if g:
+            h ^= g >> 24
+            h ^= g
+    return h
+
+
+def _hash_table_size(count: int) -> int:
+    # Same sizing as msgfmt: the smallest prime >= 4/3 of the entry count
+    size = max(3, (count * 4 + 2) // 3)
+    while any(size % d == 0 for d in range(2, int(size ** 0.5) + 1)):
+        size += 1
+    return size
+
+
+def write_mo(fp: BinaryIO, messages: Mapping[bytes, bytes]) -> None:
+    """Write a little-endian ``.mo`` file with a GNU hash table.
+
+    `messages` maps encoded originals (``msgid`` or ``msgid\\0msgid_plural``,
+    prefixed with ``msgctxt\\x04`` for contexts) to encoded translations
+    (plural forms separated by NUL). The ``b""`` key holds the metadata header.
+    """
+    keys = sorted(messages)
+    n = len(keys)
+    size = _hash_table_size(n)
+    orig_offset = 28
+    trans_offset = orig_offset + n * 8
+    hash_offset = trans_offset + n * 8
+    data_offset = hash_offset + size * 4
+
+    table = [0] * size
+    for i, key in enumerate(keys):
+        hval = hashpjw(key.split(b"\0", 1)[0])
+        idx = hval % size
+        incr = 1 + (hval % (size - 2))
+        while table[idx]:
+            if idx >= size - incr:
+                idx -= size - incr
+            else:
+                idx += incr
+        table[idx] = i + 1
+
+    strings: List[bytes] = []
+    orig_entries: List[int] = []
+    trans_entries: List[int] = []
+    offset = data_offset
+    for entries, values in ((orig_entries, keys), (trans_entries, [messages[k] for k in keys])):
+        for value in values:
+            entries += (len(value), offset)
+            strings.append(value + b"\0")
+            offset += len(value) + 1
+
+    fp.write(struct.pack("<7I", LE_MAGIC, 0, n, orig_offset, trans_offset, size, hash_offset))
+    fp.write(struct.pack(f"<{2 * n}I", *orig_entries))
+    fp.write(struct.pack(f"<{2 * n}I", *trans_entries))
+    fp.write(struct.pack(f"<{size}I", *table))
+    fp.write(b"".join(strings))
+
+
+def _map_shared(fp: BinaryIO) -> mmap.mmap:
+    return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _map_private(fp: BinaryIO, path: str) -> mmap.mmap:
+    # Anonymous memory, so later writes to the file cannot fault our pages
+    size = os.fstat(fp.fileno()).st_size
+    if size < 28:
+        raise OSError(0, "Bad magic number", path)
+    mm = mmap.mmap(-1, size)
+    view = memoryview(mm)
+    try:
+        read = 0
+        while read < size:
+            n = fp.readinto(view[read:])
+            if not n:
+                raise OSError(0, "Truncated .mo file", path)
+            read += n
+    except BaseException:
+        view.release()
+        mm.close()
+        raise
+    view.release()
+    return mm
+
+
+class MappedTranslations(support.NullTranslations):
+    """Read-only catalog backed by an mmap of a ``.mo`` file.
+
+    Supports the lookup methods of `babel.support.NullTranslations`; overlays
+    are built with ``add_fallback`` rather than ``merge``.
+
+    By default the file is read into a private anonymous mapping, so it may
+    be rewritten in place (msgfmt, Babel's ``write_mo``) while loaded. With
+    `shared` the file itself is mapped and its pages are shared with other
+    processes; truncating such a file while it is mapped crashes the process
+    (SIGBUS), so use it only for files that are replaced atomically, like
+    those written by `i18n_core.sharedstore`. The mapping is released by
+    `close` or when the object is garbage collected.
+    """
+
+    def __init__(self, path: str, domain: Optional[str] = None, shared: bool = False) -> None:
+        super().__init__(fp=None)
+        self.domain = domain or self.DEFAULT_DOMAIN
+        self.files = [path]
+        self._info: Dict[str, str] = {}
+        self._charset: Optional[str] = None
+        # msgid key -> decoded translation (plural forms split on NUL)
+        self._decoded: Dict[str, Tuple[str, ...]] = {}
+        self._sorted_index: Optional[Dict[bytes, int]] = None
+        self._sorted_checked = False
+        with open(path, "rb") as fp:
+            self._mm = _map_shared(fp) if shared else _map_private(fp, path)
+        try:
+            self._read_header()
+        except Exception:
+            self._mm.close()
+            raise
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.files[0]!r} ({self._nstrings} entries)>"
+
+    @property
+    def entry_count(self) -> int:
+        """Number of translated entries, excluding the metadata header."""
+        return self._nstrings - (1 if self._has_metadata() else 0)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    # File structure ---------------------------------------------------------
+    def _read_header(self) -> None:
+        mm = self._mm
+        if len(mm) < 28:
+            raise OSError(0, "Bad magic number", self.files[0])
+        magic = struct.unpack_from("<I", mm, 0)[0]
+        if magic == LE_MAGIC:
+            self._order = "<"
+        elif magic == BE_MAGIC:
+            self._order = ">"
+        else:
+            raise OSError(0, "Bad magic number", self.files[0])
+        _, n, orig, trans, hsize, hoff = struct.unpack_from(self._order + "6I", mm, 4)
+        self._nstrings = n
+        self._orig_offset = orig
+        self._trans_offset = trans
+        self._hash_size = hsize if hsize > 2 else 0
+        self._hash_offset = hoff
+        self._entry = struct.Struct(self._order + "2I")
+        self._slot = struct.Struct(self._order + "I")
+        if self._has_metadata():
+            self._parse_metadata(self._translation_bytes(0))
+
+    def _has_metadata(self) -> bool:
+        # The empty msgid sorts first, so the header entry is always index 0
+        return self._nstrings > 0 and self._original(0) == b""
+
+    def _parse_metadata(self, raw: bytes) -> None:
+        lastk = None
+        for b_item in raw.split(b"\n"):
+            item = b_item.decode().strip()
+            if not item:
+                continue
+            k = v = None
+            if ":" in item:
+                k, v = item.split(":", 1)
+                k = k.strip().lower()
+                v = v.strip()
+                self._info[k] = v
+                lastk = k
+            elif lastk:
+                self._info[lastk] += "\n" + item
+            if k == "content-type" and "charset=" in v:
+                self._charset = v.split("charset=")[1]
+            elif k == "plural-forms":
+                self.plural = plurals.evaluator(v)
+
+    def _original(self, idx: int) -> bytes:
+        # Original string up to the first NUL (the msgid_plural is not part of the key)
+        length, offset = self._entry.unpack_from(self._mm, self._orig_offset + idx * 8)
+        end = self._mm.find(b"\0", offset, offset + length)
+        return self._mm[offset:end if end >= 0 else offset + length]
+
+    def _matches(self, idx: int, key: bytes) -> bool:
+        length, offset = self._entry.unpack_from(self._mm, self._orig_offset + idx * 8)
+        klen = len(key)
+        if length < klen or self._mm[offset:offset + klen] != key:
+            return False
+        return length == klen or self._mm[offset + klen] == 0
+
+    def _translation_bytes(self, idx: int) -> bytes:
+        length, offset = self._entry.unpack_from(self._mm, self._trans_offset + idx * 8)
+        return self._mm[offset:offset + length]
+
+    def _find(self, key: bytes) -> Optional[int]:
+        if self._hash_size:
+            return self._find_hashed(key)
+        return self._find_sorted(key)
+
+    def _find_hashed(self, key: bytes) -> Optional[int]:
+        size = self._hash_size
+        hval = hashpjw(key)
+        idx = hval % size
+        incr = 1 + (hval % (size - 2))
+        while True:
+            nstr = self._slot.unpack_from(self._mm, self._hash_offset + idx * 4)[0]
+            if nstr == 0:
+                return None
+            nstr -= 1
+            if nstr < self._nstrings and self._matches(nstr, key):
+                return nstr
+            if idx >= size - incr:
+                idx -= size - incr
+            else:
+                idx += incr
+
+    def _find_sorted(self, key: bytes) -> Optional[int]:
+        if not self._sorted_checked:
+            self._check_sorted()
+        if self._sorted_index is not None:
+            return self._sorted_index.get(key)
+        lo, hi = 0, self._nstrings
+        while lo < hi:
+            mid = (lo + hi) // 2
+            orig = self._original(mid)
+            if orig < key:
+                lo = mid + 1
+            elif orig > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _check_sorted(self) -> None:
+        # Some writers (e.g. Babel for msgctxt entries) do not sort originals
+        # bytewise; index the keys once instead of binary searching those.
+        prev = None
+        for i in range(self._nstrings):
+            orig = self._original(i)
+            if prev is not None and orig < prev:
+                logger.debug("i18n: unsorted .mo originals, indexing keys: %s", self.files[0])
+                self._sorted_index = {self._original(j): j for j in range(self._nstrings)}
+                break
+            prev = orig
+        self._sorted_checked = True
+
+    # Lookups ----------------------------------------------------------------
+    def _lookup(self, key: str) -> Optional[Tuple[str, ...]]:
+        forms = self._decoded.get(key)
+        if forms is not None:
+            return forms
+        charset = self._charset or "ascii"
+        try:
+            raw_key = key.encode(charset)
+        except UnicodeEncodeError:
+            return None
+        idx = self._find(raw_key)
+        if idx is None:
+            return None
+        forms = tuple(self._translation_bytes(idx).decode(charset).split("\0"))
+        self._decoded[key] = forms
+        return forms
+
+    def _form(self, forms: Tuple[str, ...], n: int) -> Optional[str]:
+        i = self.plural(n)
+        return forms[i] if 0 <= i < len(forms) else None
+
+    def gettext(self, message: str) -> str:
+        forms = self._lookup(message)
+        if forms is not None:
+            tmsg = forms[0] if len(forms) == 1 else self._form(forms, 1)
+            if tmsg is not None:
+                return tmsg
+        if self._fallback:
+            return self._fallback.gettext(message)
+        return message
+
+    def ngettext(self, msgid1: str, msgid2: str, n: int) -> str:
+        forms = self._lookup(msgid1)
+        if forms is not None:
+            tmsg = self._form(forms, n)
+            if tmsg is not None:
+                return tmsg
+        if self._fallback:
+            return self._fallback.ngettext(msgid1, msgid2, n)
+        return msgid1 if n == 1 else msgid2
+
+    def pgettext(self, context: str, message: str) -> str:
+        forms = self._lookup(context + CONTEXT_SEPARATOR + message)
+        if forms is not None:
+            tmsg = forms[0] if len(forms) == 1 else self._form(forms, 1)
+            if tmsg is not None:
+                return tmsg
+        if self._fallback:
+            return self._fallback.pgettext(context, message)
+        return message
+
+    def npgettext(self, context: str, singular: str, plural: str, num: int) -> str:
+        forms = self._lookup(context + CONTEXT_SEPARATOR + singular)
+        if forms is not None:
+            tmsg = self._form(forms, num)
+            if tmsg is not None:
+                return tmsg
+        if self._fallback:
+            return self._fallback.npgettext(context, singular, plural, num)
+        return singular if num == 1 else plural
+
+    ugettext = gettext
+    ungettext = ngettext
+    upgettext = pgettext
+    unpgettext = npgettext
@@ -0,0 +1,167 @@
+"""Accept-Language negotiation against the locales installed for a domain.
+
+The available locales of a domain are indexed once (exact tag and language
+fallbacks) and re-checked at most every `locale_index.REVALIDATE_INTERVAL`
+seconds or when the registry changes. Recent header -> chain results are
+kept in a bounded LRU per index, so a repeated header costs a dict lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from . import locale_index
+from .registry import REGISTRY, _language_chain, _normalize_lang
+
+# Distinct (accepted, default) results remembered per domain
+NEGOTIATION_CACHE_SIZE = 1024
+
+
+def parse_accept_language(header: str) -> List[str]:
+    """Language tags of an Accept-Language header, most preferred first (q=0 and '*' dropped)."""
+    weighted = []
+    for position, item in enumerate(header.split(",")):
+        tag, _, params = item.strip().partition(";")
+        tag = tag.strip()
+        if not tag or tag == "*":
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            weighted.append((-q, position, tag))
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+def _key(tag: str) -> str:
+    # "de-de.UTF-8@euro" -> "de_de"
+    return (_normalize_lang(tag.split(".", 1)[0].split("@", 1)[0]) or "").lower()
+
+
+class AvailableLocales:
+    """Match index over one domain's installed locale directories."""
+
+    def __init__(self, locales: Iterable[str]) -> None:
+        self.locales = tuple(locales)
+        self._exact: Dict[str, str] = {}
+        self._by_language: Dict[str, str] = {}
+        for loc in self.locales:
+            key = _key(loc)
+            self._exact.setdefault(key, loc)
+            language = key.split("_", 1)[0]
+            # Prefer the plain language directory ("de") as the language fallback
+            if language == key or language not in self._by_language:
+                self._by_language[language] = loc
+        self.results: "OrderedDict[Tuple[object, Optional[str]], Tuple[str, ...]]" = OrderedDict()
+
+    def match(self, tag: str) -> Optional[str]:
+        """Installed locale for one tag: exact, then its language, then any same-language locale."""
+        key = _key(tag)
+        if not key:
+            return None
+        found = self._exact.get(key)
+        if found is None:
+            found = self._by_language.get(key.split("_", 1)[0])
+        return found
+
+    def negotiate(self, tags: Iterable[str], default: Optional[str]) -> Tuple[str, ...]:
+        chain: List[str] = []
+        for tag in tags:
+            found = self.match(tag)
+            if found is not None:
+                for lang in _language_chain(found, None) or ():
+                    if lang not in chain:
+                        chain.append(lang)
+        if not chain and default:
+            chain = _language_chain(default, None) or []
+        return tuple(chain)
+
+
+class _Entry:
+    __slots__ = ("index", "generation", "checked")
+
+    def __init__(self, index: AvailableLocales, generation: int) -> None:
+        self.index = index
+        self.generation = generation
+        self.checked = time.monotonic()
+
+
+_indexes: Dict[Optional[str], _Entry] = {}
+_lock = threading.Lock()
+
+
+def _available(domain: Optional[str]) -> Tuple[str, ...]:
+    from . import get_available_translations
+
+    domains = [domain] if domain is not None else REGISTRY.domains()
+    found: List[str] = []
+    for name in domains:
+        for loc in get_available_translations(name):
+            if loc not in found:
+                found.append(loc)
+    return tuple(found)
+
+
+def available_locales(domain: Optional[str] = None) -> AvailableLocales:
+    """Return the (revalidated) index for `domain`; None means every registered domain."""
+    entry = _indexes.get(domain)
+    generation = REGISTRY.generation
+    if (
+        entry is not None
+        and entry.generation == generation
+        and time.monotonic() - entry.checked < locale_index.REVALIDATE_INTERVAL
+    ):
+        return entry.index
+    locales = _available(domain)
+    with _lock:
+        entry = _indexes.get(domain)
+        if entry is not None and entry.index.locales == locales:
+            # Nothing was installed or removed; keep the cached results
+            entry.generation = generation
+            entry.checked = time.monotonic()
+            return entry.index
+        entry = _indexes[domain] = _Entry(AvailableLocales(locales), generation)
+        return entry.index
+
+
+def negotiate_locale(
+    accepted: Union[str, Iterable[str]], domain: Optional[str] = None, default: Optional[str] = None
+) -> Tuple[str, ...]:
+    """Return the language chain for a client's preferred languages.
+
+    `accepted` is an Accept-Language header or a sequence of tags in order
+    of preference. Each tag is matched against the locales installed for
+    `domain`, falling back to the same language in another region, and the
+    matches are returned with their fallbacks, most preferred first. When
+    nothing matches, the chain of `default` is returned (empty if None).
+    """
+    index = available_locales(domain)
+    key = (accepted if isinstance(accepted, str) else tuple(accepted), default)
+    results = index.results
+    chain = results.get(key)
+    if chain is not None:
+        try:
+            results.move_to_end(key)
+        except KeyError:  # evicted by another thread meanwhile
+            pass
+        return chain
+    tags = parse_accept_language(key[0]) if isinstance(key[0], str) else key[0]
+    chain = index.negotiate(tags, default)
+    with _lock:
+        results[key] = chain
+        while len(results) > NEGOTIATION_CACHE_SIZE:
+            results.popitem(last=False)
+    return chain
+
+
+def clear_cache() -> None:
+    with _lock:
+        _indexes.clear()
@@ -0,0 +1,90 @@
+"""Shared plural-form evaluators.
+
+gettext compiles the ``Plural-Forms`` expression of every catalog into its
+own function. `evaluator` interns them by the normalized expression, so all
+catalogs using the same rule (most of them use ``n != 1``) share one, and
+`plural_indices` evaluates a rule over many counts at once, calling it once
+per distinct count (with NumPy when it is installed).
+"""
+
+from __future__ import annotations
+
+import gettext
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PluralFunc = Callable[[int], int]
+
+_evaluators: Dict[str, PluralFunc] = {}
+_lock = threading.Lock()
+
+
+def germanic_plural(n: int) -> int:
+    """The rule used when a catalog declares none (``n != 1``)."""
+    return int(n != 1)
+
+
+def normalize(expression: str) -> str:
+    """Canonical form of a C plural expression: whitespace and trailing ';' removed."""
+    return "".join(expression.split()).rstrip(";")
+
+
+def plural_expression(plural_forms: str) -> Optional[str]:
+    """Extract the ``plural=`` expression from a ``Plural-Forms`` header value."""
+    for part in plural_forms.split(";"):
+        name, sep, value = part.partition("=")
+        if sep and name.strip() == "plural":
+            return normalize(value)
+    return None
+
+
+def evaluator(plural_forms: str) -> PluralFunc:
+    """Return the shared evaluator for a ``Plural-Forms`` header value.
+
+    Raises ValueError (from ``gettext.c2py``) for an invalid expression.
+    """
+    expression = plural_expression(plural_forms)
+    if expression is None:
+        return germanic_plural
+    func = _evaluators.get(expression)
+    if func is None:
+        with _lock:
+            func = _evaluators.get(expression)
+            if func is None:
+                func = _evaluators[expression] = gettext.c2py(expression)
+    return func
+
+
+def intern_catalog(translations: Any) -> None:
+    """Replace a loaded catalog's own plural function with the shared one."""
+    info = getattr(translations, "_info", None) or {}
+    plural_forms = info.get("plural-forms")
+    if plural_forms:
+        try:
+            translations.plural = evaluator(plural_forms)
+        except ValueError:
+            # Keep whatever gettext made of it
+            pass
+
+
+def plural_indices(plural: PluralFunc, counts: Iterable[int]) -> List[int]:
+    """Evaluate `plural` for every count, once per distinct value."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        values = np.asarray(counts if isinstance(counts, np.ndarray) else list(counts))
+        if values.size == 0:
+            return []
+        unique, inverse = np.unique(values, return_inverse=True)
+        table = np.array([plural(int(n)) for n in unique.tolist()])
+        return table[inverse.reshape(-1)].tolist()
+    memo: Dict[int, int] = {}
+    indices = []
+    for n in counts:
+        index = memo.get(n)
+        if index is None:
+            index = memo[n] = plural(n)
+        indices.append(index)
+    return indices
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
-import inspect
-import locale as _pylocale
+import copy
+import gettext
 import os
 import sys
 import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from types import CodeType, FrameType
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
-from babel import support
+from . import locale_index, plurals
+from .metrics import LoadEvent, RegistryStats
+
+if TYPE_CHECKING:  # Babel is imported on the first catalog load
+    from babel import support
 
 logger = getLogger("i18n_core.registry")
 
 
 DEFAULT_LOCALE = "en_US"
+# Number of language chains whose catalogs stay resident across set_locale calls
+DEFAULT_MAX_CACHED_LOCALES = 4
+# Call sites whose resolved domain is remembered; oldest dropped first
+CODE_DOMAIN_CACHE_SIZE = 4096
+# "babel": parse each .mo into a dict and merge; "mmap": see i18n_core.mofile
+CATALOG_BACKENDS = ("babel", "mmap")
 
 
 @dataclass(frozen=True)
@@ -56,16 +71,106 @@ def _language_chain(locale_id: Optional[str], languages: Optional[Iterable[str]]
     return chain
 
 
+class _LocaleOverride:
+    """Context manager (sync and async) returned by `_Registry.use_locale`."""
+
+    __slots__ = ("_var", "_value", "_token")
+
+    def __init__(self, var: "ContextVar[Optional[Tuple[str, Tuple[str, ...]]]]", value: Tuple[str, Tuple[str, ...]]) -> None:
+        self._var = var
+        self._value = value
+        self._token: Optional[Token] = None
+
+    @property
+    def locale_id(self) -> str:
+        return self._value[0]
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self._value[1])
+
+    def __enter__(self) -> "_LocaleOverride":
+        self._token = self._var.set(self._value)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._token is not None:
+            self._var.reset(self._token)
+            self._token = None
+
+    async def __aenter__(self) -> "_LocaleOverride":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.__exit__(*exc)
+
+
+def _copy_catalog(translations: support.Translations) -> support.Translations:
+    # merge() updates the catalog in place; published catalogs must not change
+    clone = copy.copy(translations)
+    clone._catalog = dict(translations._catalog)
+    clone.files = list(translations.files)
+    clone._domains = dict(translations._domains)
+    return clone
+
+
+def _lookup_prefix(mapping: Mapping[str, str], module_name: str) -> Optional[str]:
+    # "pkg.sub.mod", then "pkg.sub", then "pkg"
+    if not mapping:
+        return None
+    name = module_name
+    while True:
+        value = mapping.get(name)
+        if value is not None:
+            return value
+        name, sep, _ = name.rpartition(".")
+        if not sep:
+            return None
+
+
 class _Registry:
-    def __init__(self) -> None:
+    def __init__(self, max_cached_locales: int = DEFAULT_MAX_CACHED_LOCALES) -> None:
         self._providers: Dict[str, List[Provider]] = {}
         self._module_domain: Dict[str, str] = {}
         self._default_domain: Optional[str] = None
         self._locale_id: str = DEFAULT_LOCALE
-        self._languages: Optional[List[str]] = None
-        self._cache: Dict[Tuple[str, Tuple[str, ...]], support.NullTranslations] = {}
+        self._languages: Optional[List[str]] = _language_chain(DEFAULT_LOCALE, None)
+        self._chain: Tuple[str, ...] = tuple(self._languages or ())
+        # Per-context (thread/task) locale override: (locale_id, chain)
+        self._context_locale: ContextVar[Optional[Tuple[str, Tuple[str, ...]]]] = ContextVar(
+            f"i18n_core_locale_{id(self):x}", default=None
+        )
+        # Immutable snapshot read without the lock; writers publish a new mapping
+        self._cache: Mapping[Tuple[str, Tuple[str, ...]], support.NullTranslations] = {}
+        # Chains with resident catalogs, least recently used first
+        self._chain_lru: "OrderedDict[Tuple[str, ...], None]" = OrderedDict()
+        # Bumped on every cache clear (globally or for one domain); loads that
+        # raced with one are discarded
+        self._cache_epoch = 0
+        self._domain_epochs: Dict[str, int] = {}
+        # Catalogs dropped when a top-priority provider was added, with the
+        # providers they were built from; the next load layers the new ones on top
+        self._merge_bases: Dict[Tuple[str, Tuple[str, ...]], Tuple[Tuple[Provider, ...], support.NullTranslations]] = {}
+        # Loads in progress, shared by every requester of the same key
+        self._inflight: Dict[Tuple[str, Tuple[str, ...]], "Future[support.NullTranslations]"] = {}
+        # Keys the current thread is loading (a load listener may look one up again)
+        self._loading = threading.local()
+        self._max_cached_locales = max(1, max_cached_locales)
+        self._backend = "babel"
+        self._disk_cache_dir: Optional[str] = None
+        # Caller code object -> resolved domain; see remember_code_domain()
+        self._code_domains: Dict[CodeType, str] = {}
+        # Bumped whenever a lookup result may change (locale, providers, mappings)
+        self._generation = 0
         self._lock = threading.RLock()
         self._listeners: List[Callable[[str], None]] = []
+        self._domain_listeners: List[Callable[[Optional[str]], None]] = []
+        self._load_listeners: List[Callable[[LoadEvent], None]] = []
+        # None when collection is switched off
+        self._stats: Optional[RegistryStats] = RegistryStats()
+        # From a build manifest (see load_manifest): module prefix -> domain / locale path
+        self._manifest_modules: Dict[str, str] = {}
+        self._manifest_paths: Dict[str, str] = {}
 
     # Registration ---------------------------------------------------------
     def register_domain(self, domain: str, path: str, priority: int = 50, source: Optional[str] = None) -> None:
@@ -81,18 +186,29 @@ class _Registry:
                         domain, src, path, priority,
                     )
                     return
-            providers.append(Provider(domain=domain, path=path, priority=priority, source=src))
+            previous = tuple(providers)
+            provider = Provider(domain=domain, path=path, priority=priority, source=src)
+            providers.append(provider)
+            # Start from a fresh directory index for a newly registered path
+            locale_index.invalidate(path)
             # Keep stable order, but sort by priority (tie resolved by insertion order)
             providers.sort(key=lambda p: p.priority)
             logger.info(
                 "i18n: registered provider: domain=%s source=%s path=%s priority=%s (total=%d)",
                 domain, src, path, priority, len(providers),
             )
-            self._clear_cache_locked()
+            # Only this domain's catalogs are stale; a provider that sorts last
+            # overrides everything, so it can be merged onto the old catalogs
+            self._invalidate_domain_locked(domain, layer_from=previous if providers[-1] is provider else None)
+            self._code_domains.clear()
+            self._generation += 1
+            self._notify_domain_change_locked(domain)
 
     def set_module_domain(self, module_name: str, domain: str) -> None:
         with self._lock:
             self._module_domain[module_name] = domain
+            self._code_domains.clear()
+            self._generation += 1
 
     def get_module_domain(self, module_name: str) -> Optional[str]:
         return self._module_domain.get(module_name)
@@ -100,11 +216,22 @@ class _Registry:
     def set_default_domain(self, domain: Optional[str]) -> None:
         with self._lock:
             self._default_domain = domain
+            self._code_domains.clear()
+            self._generation += 1
             logger.debug("i18n: default domain set: %s", domain)
 
     def get_default_domain(self) -> Optional[str]:
         return self._default_domain
 
+    def domains(self) -> List[str]:
+        """Domains with at least one registered provider."""
+        return list(self._providers)
+
+    def cached_domains(self) -> List[str]:
+        """Domains with a cached catalog for the current language chain."""
+        chain = self.active_chain()
+        return [domain for domain, cached_chain in self._cache if cached_chain == chain]
+
     def providers_for(self, domain: str) -> List[Provider]:
         return list(self._providers.get(domain, ()))
 
@@ -116,7 +243,10 @@ class _Registry:
             normalized = _normalize_lang(locale_id) or DEFAULT_LOCALE
             self._locale_id = normalized
             self._languages = _language_chain(normalized, languages)
-            self._clear_cache_locked()
+            self._chain = tuple(self._languages or ())
+            # Catalogs are keyed by chain, so other locales stay cached for a quick switch back
+            self._touch_chain_locked(self._chain)
+            self._generation += 1
             logger.info("i18n: locale set: %s chain=%s", self._locale_id, self._languages)
             for cb in list(self._listeners):
                 try:
@@ -125,12 +255,137 @@ class _Registry:
                     logger.exception("Error in on_locale_change callback")
             return self._locale_id
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever previously translated strings may be stale."""
+        return self._generation
+
     def get_locale(self) -> str:
+        override = self._context_locale.get()
+        if override is not None:
+            return override[0]
         return self._locale_id
 
     def get_languages(self) -> Optional[List[str]]:
+        override = self._context_locale.get()
+        if override is not None:
+            return list(override[1]) or None
         return list(self._languages) if self._languages else None
 
+    def use_locale(self, locale_id: str, languages: Optional[Iterable[str]] = None) -> _LocaleOverride:
+        """Override the locale for the current context only.
+
+        Usable as ``with`` or ``async with``; the override is held in a
+        ContextVar, so other threads and asyncio tasks keep their own locale.
+        No process-wide state is touched and catalogs come from the shared
+        per-chain cache.
+        """
+        normalized = _normalize_lang(locale_id) or DEFAULT_LOCALE
+        chain = tuple(_language_chain(normalized, languages) or ())
+        try:
+            # Best-effort, lock-free: keep catalogs of locales in active use from being evicted
+            self._chain_lru.move_to_end(chain)
+        except KeyError:  # not cached yet, or evicted meanwhile
+            pass
+        return _LocaleOverride(self._context_locale, (normalized, chain))
+
+    def active_chain(self) -> Tuple[str, ...]:
+        """Language chain used for lookups in the current context."""
+        override = self._context_locale.get()
+        return override[1] if override is not None else self._chain
+
+    def has_context_locale(self) -> bool:
+        return self._context_locale.get() is not None
+
+    def set_catalog_backend(self, backend: str) -> None:
+        """Select how .mo files are loaded: "babel" (default) or "mmap".
+
+        The "mmap" backend maps each file and decodes strings on demand; the
+        providers of a domain are overlaid with fallbacks instead of merged.
+        """
+        if backend not in CATALOG_BACKENDS:
+            raise ValueError(f"Unknown catalog backend {backend!r}; expected one of {CATALOG_BACKENDS}")
+        with self._lock:
+            if backend != self._backend:
+                self._backend = backend
+                self._clear_cache_locked()
+                self._generation += 1
+                self._notify_domain_change_locked(None)
+                logger.info("i18n: catalog backend set: %s", backend)
+
+    def get_catalog_backend(self) -> str:
+        return self._backend
+
+    def set_disk_cache_dir(self, path: Optional[str]) -> None:
+        """Persist merged catalogs under `path` (None disables the disk cache).
+
+        Applies to the "babel" backend. Entries are keyed by domain, language
+        chain and providers, and are rebuilt when a source .mo file changes.
+        """
+        with self._lock:
+            self._disk_cache_dir = os.fspath(path) if path is not None else None
+
+    def get_disk_cache_dir(self) -> Optional[str]:
+        return self._disk_cache_dir
+
+    def set_max_cached_locales(self, count: int) -> None:
+        """Set how many language chains keep their catalogs cached (LRU, minimum 1).
+
+        The chain of the process-wide locale (``set_locale``) is never evicted.
+        """
+        with self._lock:
+            self._max_cached_locales = max(1, int(count))
+            self._evict_chains_locked()
+
+    def get_max_cached_locales(self) -> int:
+        return self._max_cached_locales
+
+    # Build manifest -----------------------------------------------------
+    def load_manifest(self, path: str) -> int:
+        """Register the providers recorded by ``python -m i18n_core.manifest``.
+
+        The manifest is read once. Its locale directories are indexed from
+        the recorded file lists instead of being scanned, and modules under
+        its package prefixes resolve their domain and locale path without
+        probing the filesystem. Returns the number of providers registered.
+        Raises OSError or ValueError if the manifest cannot be used.
+        """
+        from . import manifest
+
+        data = manifest.read(os.fspath(path))
+        catalogs: Dict[str, Dict[str, Dict[str, str]]] = {}
+        paths: Dict[str, str] = {}
+        count = 0
+        for domain, entries in data["domains"].items():
+            for entry in entries:
+                self.register_domain(domain, entry["path"], priority=entry["priority"], source=entry["source"])
+                if entry["source"] in data["modules"]:
+                    paths[entry["source"]] = entry["path"]
+                per_path = catalogs.setdefault(entry["path"], {})
+                for loc, mo in entry["catalogs"].items():
+                    per_path.setdefault(loc, {})[domain] = mo
+                count += 1
+        # After register_domain, which drops any index of a newly registered path
+        for locale_path, path_catalogs in catalogs.items():
+            locale_index.seed(locale_index.LocaleDirIndex.from_catalogs(locale_path, path_catalogs))
+        with self._lock:
+            self._manifest_modules.update(data["modules"])
+            self._manifest_paths.update(paths)
+            if data.get("default_domain") and self._default_domain is None:
+                self._default_domain = data["default_domain"]
+            self._code_domains.clear()
+            self._generation += 1
+        logger.info("i18n: loaded manifest %s: %d providers", path, count)
+        return count
+
+    def manifest_domain(self, module_name: str) -> Optional[str]:
+        """Domain recorded in a loaded manifest for `module_name` or its parent packages."""
+        return _lookup_prefix(self._manifest_modules, module_name)
+
+    def manifest_locale_path(self, module_name: str) -> Optional[str]:
+        """Locale directory recorded in a loaded manifest for `module_name`'s package."""
+        return _lookup_prefix(self._manifest_paths, module_name)
+
     def on_locale_change(self, callback: Callable[[str], None]) -> Callable[[], None]:
         with self._lock:
             self._listeners.append(callback)
@@ -142,59 +397,579 @@ class _Registry:
 
         return unsubscribe
 
+    def on_domain_change(self, callback: Callable[[Optional[str]], None]) -> Callable[[], None]:
+        """Call `callback(domain)` when the catalogs of a domain may have changed.
+
+        `domain` is None when every domain is affected (e.g. a backend switch).
+        Locale changes are reported separately through `on_locale_change`.
+        """
+        with self._lock:
+            self._domain_listeners.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._domain_listeners:
+                    self._domain_listeners.remove(callback)
+
+        return unsubscribe
+
+    # Metrics -------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        """Counters since the last reset: cache hits/misses, loads, merges, resolution, missing msgids.
+
+        Returns an empty structure with ``"enabled": False`` while collection is off.
+        """
+        stats = self._stats
+        if stats is None:
+            return {"enabled": False, "domains": {}, "providers": [], "resolution": {"count": 0, "seconds": 0.0}}
+        return {"enabled": True, **stats.snapshot()}
+
+    def enable_stats(self, enabled: bool = True) -> None:
+        """Switch metrics collection on or off (off removes all bookkeeping from lookups)."""
+        with self._lock:
+            if enabled == (self._stats is not None):
+                return
+            self._stats = RegistryStats() if enabled else None
+            # Pre-bound wrappers pick instrumented or plain functions on rebind
+            self._notify_domain_change_locked(None)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            if self._stats is not None:
+                self._stats = RegistryStats()
+
+    def record_missing(self, domain: str, msgid: str) -> None:
+        """Count a lookup of `msgid` that found no translation in `domain`."""
+        stats = self._stats
+        if stats is not None:
+            stats.record_missing(domain, msgid)
+
+    def on_load(self, callback: Callable[[LoadEvent], None]) -> Callable[[], None]:
+        """Call `callback(LoadEvent)` whenever a (domain, chain) catalog is built.
+
+        Callbacks run on the loading thread while the catalog is still in
+        flight. They may look up translations, but two callbacks that each
+        wait for a catalog the other thread is loading deadlock.
+        """
+        with self._lock:
+            self._load_listeners.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._load_listeners:
+                    self._load_listeners.remove(callback)
+
+        return unsubscribe
+
+    # Caller resolution cache ---------------------------------------------
+    def domain_for_code(self, code: CodeType) -> Optional[str]:
+        """Return the domain previously resolved for a call site, if any."""
+        return self._code_domains.get(code)
+
+    def remember_code_domain(self, code: CodeType, domain: str, generation: int) -> None:
+        """Cache the domain resolved for a call site.
+
+        `generation` is `self.generation` read before resolving; the entry is
+        not stored if anything changed since, so a resolution racing with
+        ``register_domain``, ``set_module_domain`` or ``set_default_domain``
+        (which drop all entries) cannot leave a stale domain behind.
+        """
+        with self._lock:
+            if self._generation != generation:
+                return
+            codes = self._code_domains
+            while len(codes) >= CODE_DOMAIN_CACHE_SIZE:
+                del codes[next(iter(codes))]
+            codes[code] = domain
+
     # Translation resolution ----------------------------------------------
     def get_domain_translations(self, domain: str) -> support.NullTranslations:
+        # Lock-free fast path: a cache hit is a single lookup in the published snapshot
+        override = self._context_locale.get()
+        key = (domain, override[1] if override is not None else self._chain)
+        cached = self._cache.get(key)
+        stats = self._stats
+        if cached is not None:
+            if stats is not None:
+                stats.hits[domain] += 1
+            return cached
+        if key in getattr(self._loading, "keys", ()):
+            # Re-entered from this thread's own load; waiting on it would deadlock
+            if stats is not None:
+                stats.misses[domain] += 1
+            return self._load_domain(*key)
+        if self._lock._is_owned():  # type: ignore[attr-defined]
+            # Called from a listener that runs under the registry lock: another
+            # thread's load of this key needs the lock to publish, so waiting on
+            # it would deadlock. Load and publish here instead.
+            if stats is not None:
+                stats.misses[domain] += 1
+            future: "Future[support.NullTranslations]" = Future()
+            self._complete_load(key, future, self._epoch_locked(domain))
+            return future.result()
+        # Single flight per key: files are read outside the registry lock and
+        # concurrent requesters of the same key wait for the one load
+        return self._shared_load(key, run_inline=True, count_miss=True)[0].result()
+
+    def reload(self, keys: Iterable[Tuple[str, Tuple[str, ...]]]) -> int:
+        """Reload cached (domain, chain) catalogs from disk and swap them in.
+
+        New catalogs are fully loaded before a single snapshot swap, so
+        lookups see either the old or the new catalog, never a partial
+        merge. Keys that are not cached are ignored. Returns the number of
+        catalogs replaced.
+        """
+        with self._lock:
+            keys = [key for key in dict.fromkeys(keys) if key in self._cache]
+            epochs = {key[0]: self._epoch_locked(key[0]) for key in keys}
+        if not keys:
+            return 0
+        fresh = {key: self._load_domain(*key) for key in keys}
+        with self._lock:
+            cache = dict(self._cache)
+            # Skip domains whose providers changed meanwhile; they reload from scratch anyway
+            replaced = {
+                key: t for key, t in fresh.items() if key in cache and self._epoch_locked(key[0]) == epochs[key[0]]
+            }
+            if not replaced:
+                return 0
+            cache.update(replaced)
+            self._cache = cache
+            self._generation += 1
+            logger.info("i18n: reloaded catalogs: %s", sorted(replaced))
+            for domain in sorted({key[0] for key in replaced}):
+                self._notify_domain_change_locked(domain)
+        return len(replaced)
+
+    async def aget_domain_translations(self, domain: str) -> support.NullTranslations:
+        """Awaitable `get_domain_translations` that loads catalogs in an executor.
+
+        Concurrent requests for the same (domain, chain) share one load, and
+        the result is published to the cache only once it is complete.
+        """
+        override = self._context_locale.get()
+        key = (domain, override[1] if override is not None else self._chain)
+        cached = self._cache.get(key)
+        stats = self._stats
+        if cached is not None:
+            if stats is not None:
+                stats.hits[domain] += 1
+            return cached
+        return await self._aload_key(key, count_miss=True)
+
+    async def apreload(
+        self, domains: Optional[Iterable[str]] = None, locales: Optional[Iterable[str]] = None
+    ) -> None:
+        """Awaitable `preload`: load the requested catalogs without blocking the event loop."""
+        domain_list = list(domains) if domains is not None else list(self._providers)
+        chains = [self._chain] if locales is None else [self._chain_for_locale(loc) for loc in locales]
+        keys = {(d, c) for c in chains for d in domain_list}
+        import asyncio
+
+        await asyncio.gather(*(self._aload_key(key) for key in keys if key not in self._cache))
+
+    async def _aload_key(self, key: Tuple[str, Tuple[str, ...]], count_miss: bool = False) -> support.NullTranslations:
+        future, _ = self._shared_load(key, run_inline=False, count_miss=count_miss)
+        if future.done():
+            return future.result()
+        import asyncio
+
+        # shield: one cancelled waiter must not cancel the load for the others
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _shared_load(
+        self, key: Tuple[str, Tuple[str, ...]], run_inline: bool, count_miss: bool = False
+    ) -> Tuple["Future[support.NullTranslations]", bool]:
+        """Return the future for `key` and whether this call started its load.
+
+        With `count_miss`, a cache miss is recorded if this call starts the
+        load; requesters that find it cached or in flight are not counted.
+        Waiting is safe when a load listener looks up the key its own thread
+        is loading (see `get_domain_translations`), but not when listeners on
+        two threads look up each other's in-flight keys: both wait forever.
+        """
         with self._lock:
-            chain_tuple: Tuple[str, ...] = tuple(self._languages or [])
-            key = (domain, chain_tuple)
             cached = self._cache.get(key)
             if cached is not None:
-                logger.debug("i18n: cache hit for domain=%s chain=%s", domain, chain_tuple)
-                return cached
-            logger.debug(
-                "i18n: cache miss for domain=%s chain=%s providers=%d",
-                domain, chain_tuple, len(self._providers.get(domain, [])),
+                future: "Future[support.NullTranslations]" = Future()
+                future.set_result(cached)
+                return future, False
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            epoch = self._epoch_locked(key[0])
+            stats = self._stats
+            if count_miss and stats is not None:
+                stats.misses[key[0]] += 1
+        if run_inline:
+            self._complete_load(key, future, epoch)
+        else:
+            import asyncio
+
+            asyncio.get_running_loop().run_in_executor(None, self._complete_load, key, future, epoch)
+        return future, True
+
+    def _complete_load(
+        self, key: Tuple[str, Tuple[str, ...]], future: "Future[support.NullTranslations]", epoch: Tuple[int, int]
+    ) -> None:
+        loading = self._loading.__dict__.setdefault("keys", set())
+        loading.add(key)
+        try:
+            translations = self._load_domain(*key)
+        except BaseException as exc:
+            with self._lock:
+                self._forget_inflight_locked(key, future)
+            future.set_exception(exc)
+            return
+        finally:
+            loading.discard(key)
+        with self._lock:
+            self._forget_inflight_locked(key, future)
+            # A cache clear during the load means the providers changed; don't publish stale data
+            if self._epoch_locked(key[0]) == epoch and key not in self._cache:
+                self._publish_locked(key, translations)
+                logger.debug("i18n: cached translations for domain=%s chain=%s", key[0], key[1])
+            translations = self._cache.get(key, translations)
+        future.set_result(translations)
+
+    def _forget_inflight_locked(self, key: Tuple[str, Tuple[str, ...]], future: "Future[support.NullTranslations]") -> None:
+        # Only drop our own entry; a cache clear may have started a newer load
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def _chain_for_locale(self, locale_id: str) -> Tuple[str, ...]:
+        return tuple(_language_chain(_normalize_lang(locale_id) or DEFAULT_LOCALE, None) or ())
+
+    def preload(
+        self,
+        domains: Optional[Iterable[str]] = None,
+        locales: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        background: bool = False,
+    ) -> Union[int, "Future[int]"]:
+        """Load and cache catalogs ahead of the first lookup.
+
+        Loads every (domain, chain) pair for `domains` (default: all registered
+        domains) and `locales` (default: the current language chain) in a
+        thread pool. Returns the number of catalogs newly cached, or a Future
+        for it when `background` is true. Only the most recent
+        ``max_cached_locales`` locales stay resident.
+        """
+        with self._lock:
+            domain_list = list(domains) if domains is not None else list(self._providers)
+            if locales is None:
+                chains = [self._chain]
+            else:
+                chains = []
+                for loc in locales:
+                    chain = self._chain_for_locale(loc)
+                    if chain not in chains:
+                        chains.append(chain)
+            keys = [(d, c) for c in chains for d in domain_list if (d, c) not in self._cache]
+
+        def load(key: Tuple[str, Tuple[str, ...]]) -> bool:
+            # Shares the in-flight load with concurrent lookups of the same key
+            future, claimed = self._shared_load(key, run_inline=True)
+            translations = future.result()
+            return claimed and self._cache.get(key) is translations
+
+        def run() -> int:
+            if not keys:
+                return 0
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="i18n-preload") as pool:
+                loaded = sum(pool.map(load, keys))
+            logger.debug("i18n: preloaded %d catalogs for domains=%s chains=%s", loaded, domain_list, chains)
+            return loaded
+
+        if not background:
+            return run()
+        future: "Future[int]" = Future()
+
+        def run_in_background() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(run())
+            except BaseException as exc:  # pragma: no cover
+                future.set_exception(exc)
+
+        threading.Thread(target=run_in_background, name="i18n-preload", daemon=True).start()
+        return future
+
+    def export_shared(
+        self, directory: str, domains: Optional[Iterable[str]] = None, locales: Optional[Iterable[str]] = None
+    ) -> str:
+        """Write merged catalogs to a store other processes can `attach_shared`.
+
+        Exports every (domain, chain) pair for `domains` (default: all
+        registered domains) and `locales` (default: the current chain) as
+        hashed ``.mo`` files plus a manifest, and returns the manifest path.
+        Uncached catalogs are loaded for the export without being cached.
+        Catalogs that don't hold their entries in memory (the "mmap"
+        backend, attached stores) are merged with Babel for the export.
+        """
+        from . import sharedstore
+
+        with self._lock:
+            domain_list = list(domains) if domains is not None else list(self._providers)
+            chains = [self._chain] if locales is None else list(dict.fromkeys(self._chain_for_locale(l) for l in locales))
+            providers = {d: [(p.path, p.priority) for p in self._providers.get(d, ())] for d in domain_list}
+        catalogs = []
+        for chain in chains:
+            for domain in domain_list:
+                translations = self._cache.get((domain, chain)) or self._load_domain(domain, chain)
+                if not sharedstore.exportable(translations):
+                    translations = self._build_domain(domain, chain, backend="babel")[0]
+                catalogs.append((domain, chain, translations, providers[domain]))
+        return sharedstore.export(os.fspath(directory), catalogs)
+
+    def attach_shared(self, manifest: str) -> int:
+        """Serve catalogs from a store written by `export_shared`.
+
+        Each catalog is memory-mapped read-only, so processes attached to the
+        same store share its pages. Entries whose source files changed since
+        the export, or whose domain now has different providers, are skipped
+        and load normally. Returns the number of catalogs attached.
+        """
+        from . import sharedstore
+        from .mofile import MappedTranslations
+
+        opened = []
+        for entry in sharedstore.read_manifest(os.fspath(manifest)):
+            # Store files are only ever replaced atomically, so map them shared
+            try:
+                t = MappedTranslations(entry["path"], domain=entry["domain"], shared=True)
+            except OSError as exc:
+                logger.warning("i18n: cannot map shared catalog %s (%s)", entry["path"], exc)
+                continue
+            opened.append(((entry["domain"], tuple(entry["chain"])), t, entry["providers"]))
+        attached = set()
+        with self._lock:
+            # Publish the current chain last so the LRU keeps it resident
+            opened.sort(key=lambda item: item[0][1] == self._chain)
+            for key, t, providers in opened:
+                if [[p.path, p.priority] for p in self._providers.get(key[0], ())] != providers:
+                    continue
+                self._publish_locked(key, t)
+                attached.add(key)
+            if attached:
+                self._generation += 1
+                for domain in sorted({key[0] for key in attached}):
+                    self._notify_domain_change_locked(domain)
+        logger.info("i18n: attached %d shared catalogs from %s", len(attached), manifest)
+        return len(attached)
+
+    def _load_domain(self, domain: str, chain: Tuple[str, ...]) -> support.NullTranslations:
+        start = time.perf_counter()
+        translations, from_disk_cache = self._build_domain(domain, chain)
+        if self._load_listeners:
+            event = LoadEvent(
+                domain=domain,
+                chain=chain,
+                files=tuple(getattr(translations, "files", ())),
+                seconds=time.perf_counter() - start,
+                from_disk_cache=from_disk_cache,
             )
-            providers = self._providers.get(domain, [])
-            translations: Optional[support.NullTranslations] = None
-            for prov in providers:
-                logger.debug(
-                    "i18n: loading translations: domain=%s path=%s locales=%s",
-                    domain, prov.path, self._languages,
+            for cb in list(self._load_listeners):
+                try:
+                    cb(event)
+                except Exception:  # pragma: no cover
+                    logger.exception("Error in on_load callback")
+        return translations
+
+    def _build_domain(
+        self, domain: str, chain: Tuple[str, ...], backend: Optional[str] = None
+    ) -> Tuple[support.NullTranslations, bool]:
+        # Safe without the lock: works on a copy of the provider list
+        stats = self._stats
+        providers = list(self._providers.get(domain, ()))
+        logger.debug("i18n: cache miss for domain=%s chain=%s providers=%d", domain, chain, len(providers))
+        locales = list(chain) or None
+        sources = self._find_catalog_files(domain, providers, locales)
+        if (backend or self._backend) == "mmap":
+            return self._load_mapped(domain, sources), False
+        from babel import support
+
+        cache_entry = None
+        if self._disk_cache_dir:
+            from . import diskcache
+
+            stamps = diskcache.source_stamps(f for _, f in sources if f)
+            if stamps is not None:
+                cache_entry = (
+                    diskcache.entry_path(self._disk_cache_dir, domain, chain, [(p.path, p.priority) for p in providers]),
+                    stamps,
                 )
+                cached = diskcache.load(cache_entry[0], stamps, domain)
+                if cached is not None:
+                    logger.debug("i18n: loaded merged catalog from disk cache: domain=%s chain=%s", domain, chain)
+                    if stats is not None:
+                        stats.disk_cache_hits[domain] += 1
+                    return cached, True
+        translations: Optional[support.NullTranslations] = None
+        base = self._merge_bases.get((domain, chain))
+        # Only a babel catalog can be extended; others (mapped, attached) are rebuilt in full
+        if (
+            base is not None
+            and isinstance(base[1], support.Translations)
+            and tuple(providers[: len(base[0])]) == base[0]
+        ):
+            # Only providers added on top since `base` was built need loading
+            sources = sources[len(base[0]):]
+            translations = _copy_catalog(base[1])
+            logger.debug("i18n: layering %d new provider(s) onto cached catalog: domain=%s", len(sources), domain)
+        for prov, filename in sources:
+            if not filename:
+                logger.debug("i18n: empty translations: domain=%s path=%s", domain, prov.path)
+                continue
+            logger.debug("i18n: loading translations: domain=%s file=%s", domain, filename)
+            start = time.perf_counter()
+            try:
+                with open(filename, "rb") as fp:
+                    t = support.Translations(fp=fp, domain=domain)
+                plurals.intern_catalog(t)
+            except Exception:
+                logger.exception("i18n: error loading translations: domain=%s path=%s", domain, prov.path)
+                continue
+            if stats is not None:
+                stats.record_load(domain, prov.path, time.perf_counter() - start)
+            # Skip NullTranslations with no content
+            if isinstance(t, support.NullTranslations) and not getattr(t, "_catalog", None):
+                logger.debug("i18n: empty translations: domain=%s path=%s", domain, prov.path)
+                continue
+            if translations is None:
+                translations = t
+            else:
+                # Overlay: lower priority merged first, higher overrides
+                start = time.perf_counter()
                 try:
-                    t = support.Translations.load(prov.path, locales=self._languages, domain=domain)
+                    translations.merge(t)  # type: ignore[attr-defined]
+                    logger.debug("i18n: merged translations for domain=%s from %s", domain, prov.path)
                 except Exception:
-                    logger.exception("i18n: error loading translations: domain=%s path=%s", domain, prov.path)
-                    continue
-                # Skip NullTranslations with no content
-                if isinstance(t, support.NullTranslations) and not getattr(t, "_catalog", None):
-                    logger.debug("i18n: empty translations: domain=%s path=%s", domain, prov.path)
-                    continue
-                if translations is None:
-                    translations = t
-                else:
-                    # Overlay: lower priority merged first, higher overrides
+                    # Fall back: add as domain catalog to keep accessibility via d* functions
                     try:
-                        translations.merge(t)  # type: ignore[attr-defined]
-                        logger.debug("i18n: merged translations for domain=%s from %s", domain, prov.path)
+                        translations.add(t)  # type: ignore[attr-defined]
+                        logger.debug("i18n: added domain catalog for domain=%s from %s", domain, prov.path)
                     except Exception:
-                        # Fall back: add as domain catalog to keep accessibility via d* functions
-                        try:
-                            translations.add(t)  # type: ignore[attr-defined]
-                            logger.debug("i18n: added domain catalog for domain=%s from %s", domain, prov.path)
-                        except Exception:
-                            logger.exception("i18n: failed to merge/add translations: domain=%s", domain)
+                        logger.exception("i18n: failed to merge/add translations: domain=%s", domain)
+                if stats is not None:
+                    stats.merge_seconds[domain] += time.perf_counter() - start
 
-            if translations is None:
-                translations = support.NullTranslations()
+        if translations is None:
+            translations = support.NullTranslations()
+        elif cache_entry is not None:
+            diskcache.store(cache_entry[0], cache_entry[1], translations)
+        return translations, False
+
+    def _find_catalog_files(
+        self, domain: str, providers: List[Provider], locales: Optional[List[str]]
+    ) -> List[Tuple[Provider, Optional[str]]]:
+        # The .mo file each provider contributes: the first match along the chain
+        if locales is None:
+            # Language taken from the environment; let gettext resolve it
+            return [(prov, gettext.find(domain, prov.path, locales)) for prov in providers]
+        return [(prov, locale_index.get_index(prov.path).find(domain, locales)) for prov in providers]
+
+    def _load_mapped(
+        self, domain: str, sources: List[Tuple[Provider, Optional[str]]]
+    ) -> support.NullTranslations:
+        from babel import support
 
-            self._cache[key] = translations
-            logger.debug("i18n: cached translations for domain=%s chain=%s", domain, chain_tuple)
-            return translations
+        from .mofile import MappedTranslations
+
+        layers: List[MappedTranslations] = []
+        for prov, filename in sources:
+            if not filename:
+                logger.debug("i18n: empty translations: domain=%s path=%s", domain, prov.path)
+                continue
+            start = time.perf_counter()
+            try:
+                t = MappedTranslations(filename, domain=domain)
+            except Exception:
+                logger.exception("i18n: error loading translations: domain=%s path=%s", domain, prov.path)
+                continue
+            stats = self._stats
+            if stats is not None:
+                stats.record_load(domain, prov.path, time.perf_counter() - start)
+            if not t.entry_count:
+                logger.debug("i18n: empty translations: domain=%s path=%s", domain, prov.path)
+                continue
+            layers.append(t)
+        if not layers:
+            return support.NullTranslations()
+        # Overlay without copying: the highest priority answers first, lower ones are fallbacks
+        translations = layers[-1]
+        for lower in reversed(layers[:-1]):
+            translations.add_fallback(lower)
+        return translations
+
+    def _publish_locked(self, key: Tuple[str, Tuple[str, ...]], translations: support.NullTranslations) -> None:
+        # Copy-on-write so concurrent readers always see a complete mapping
+        cache = dict(self._cache)
+        cache[key] = translations
+        self._cache = cache
+        self._merge_bases.pop(key, None)
+        self._touch_chain_locked(key[1])
+
+    def _touch_chain_locked(self, chain: Tuple[str, ...]) -> None:
+        self._chain_lru[chain] = None
+        self._chain_lru.move_to_end(chain)
+        self._evict_chains_locked()
+
+    def _evict_chains_locked(self) -> None:
+        evicted = set()
+        while len(self._chain_lru) > self._max_cached_locales:
+            # The set_locale chain is pinned; per-context overrides only evict each other
+            chain = next(c for c in self._chain_lru if c != self._chain)
+            del self._chain_lru[chain]
+            evicted.add(chain)
+        if evicted:
+            logger.debug("i18n: evicting cached catalogs for chains=%s", sorted(evicted))
+            self._cache = {k: v for k, v in self._cache.items() if k[1] not in evicted}
+            self._merge_bases = {k: v for k, v in self._merge_bases.items() if k[1] not in evicted}
 
     def _clear_cache_locked(self) -> None:
-        self._cache.clear()
+        self._cache = {}
+        self._merge_bases = {}
+        self._chain_lru.clear()
+        self._cache_epoch += 1
+        self._inflight = {}
+
+    def _invalidate_domain_locked(self, domain: str, layer_from: Optional[Tuple[Provider, ...]] = None) -> None:
+        """Drop the cached catalogs of one domain, leaving other domains alone.
+
+        With `layer_from` (the providers before a new top-priority one was
+        added) the dropped catalogs are kept as merge bases, so their next
+        load only reads the new provider's file.
+        """
+        bases = {k: v for k, v in self._merge_bases.items() if k[0] != domain}
+        cache = {}
+        for key, translations in self._cache.items():
+            if key[0] != domain:
+                cache[key] = translations
+            elif layer_from is not None and self._backend == "babel":
+                bases[key] = (layer_from, translations)
+        if layer_from is not None:
+            # Bases from an earlier registration stay valid: their providers are still a prefix
+            bases.update((k, v) for k, v in self._merge_bases.items() if k[0] == domain and k not in bases)
+        self._cache = cache
+        self._merge_bases = bases
+        self._domain_epochs[domain] = self._domain_epochs.get(domain, 0) + 1
+        self._inflight = {k: f for k, f in self._inflight.items() if k[0] != domain}
+
+    def _epoch_locked(self, domain: str) -> Tuple[int, int]:
+        return (self._cache_epoch, self._domain_epochs.get(domain, 0))
+
+    def _notify_domain_change_locked(self, domain: Optional[str]) -> None:
+        for cb in list(self._domain_listeners):
+            try:
+                cb(domain)
+            except Exception:  # pragma: no cover
+                logger.exception("Error in on_domain_change callback")
 
 
 REGISTRY = _Registry()
@@ -205,24 +980,38 @@ def infer_domain_from_module(module_name: str) -> str:
     return module_name.split(".")[0]
 
 
-def get_calling_module_name() -> Optional[str]:
-    # Inspect the stack to find the first non-i18n_core module
-    for frame_info in inspect.stack()[2:]:  # skip our wrapper and its immediate caller
-        frame = frame_info.frame
+def get_calling_frame() -> Optional[FrameType]:
+    """Return the innermost frame that does not belong to i18n_core.
+
+    Walks raw frames via ``f_back`` instead of ``inspect.stack()``, which
+    would build FrameInfo objects and read source lines for the whole stack.
+    """
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
         mod_name = frame.f_globals.get("__name__")
-        if not mod_name:
-            continue
-        if mod_name.startswith("i18n_core"):
-            continue
-        return mod_name
+        if mod_name and not mod_name.startswith("i18n_core"):
+            return frame
+        frame = frame.f_back
     return None
 
 
+def get_calling_module_name() -> Optional[str]:
+    # Find the first non-i18n_core module on the stack
+    frame = get_calling_frame()
+    if frame is None:
+        return None
+    return frame.f_globals.get("__name__")
+
+
 def ensure_inferred_provider(module_name: str, module_file: Optional[str]) -> Optional[str]:
     """Ensure that a provider exists for the inferred domain.
 
     Returns the inferred domain name if registration happened or was already present.
     """
+    domain = REGISTRY.manifest_domain(module_name)
+    if domain is not None:
+        # Recorded at build time; nothing to probe
+        return domain
     domain = infer_domain_from_module(module_name)
     existing = REGISTRY.providers_for(domain)
     if existing:
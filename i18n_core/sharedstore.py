@@ -0,0 +1,140 @@
+"""Read-only catalog store shared between processes.
+
+`export` writes merged catalogs as hashed ``.mo`` files (see
+`mofile.write_mo`) plus a JSON manifest keyed by (domain, chain). Processes
+`attach` to the store by memory-mapping those files with
+`mofile.MappedTranslations`, so the pages are shared through the OS page
+cache instead of every worker parsing and merging its own copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from babel import support
+
+from . import diskcache
+from .mofile import write_mo
+
+logger = getLogger("i18n_core.sharedstore")
+
+MANIFEST_NAME = "manifest.json"
+# Bump when the manifest layout changes
+FORMAT_VERSION = 1
+
+
+def catalog_messages(catalog: Mapping[Any, str], info: Mapping[str, str]) -> Dict[bytes, bytes]:
+    """Convert a gettext ``_catalog`` into `write_mo` input (UTF-8)."""
+    messages: Dict[bytes, bytes] = {}
+    plural_forms: Dict[str, Dict[int, str]] = {}
+    for key, value in catalog.items():
+        if isinstance(key, tuple):
+            plural_forms.setdefault(key[0], {})[key[1]] = value
+        elif key:
+            messages[key.encode("utf-8")] = value.encode("utf-8")
+    for msgid, forms in plural_forms.items():
+        # The msgid_plural is not kept by gettext; lookups only use the singular
+        raw = msgid.encode("utf-8")
+        if raw not in messages:
+            ordered = [forms.get(i, "") for i in range(max(forms) + 1)]
+            messages[raw + b"\0" + raw] = "\0".join(ordered).encode("utf-8")
+    header = {k: v for k, v in info.items() if k != "content-type"}
+    lines = ["Content-Type: text/plain; charset=UTF-8"]
+    lines += [f"{k.title()}: {v}" for k, v in header.items() if "\n" not in v]
+    messages[b""] = ("\n".join(lines) + "\n").encode("utf-8")
+    return messages
+
+
+def exportable(translations: Any) -> bool:
+    """Whether `translations` holds all of its entries in ``_catalog``.
+
+    True for babel catalogs and empty `NullTranslations`; False for
+    `mofile.MappedTranslations`, whose inherited ``_catalog`` is empty.
+    """
+    return isinstance(translations, support.Translations) or type(translations) is support.NullTranslations
+
+
+def _entry_name(domain: str, chain: Sequence[str]) -> str:
+    digest = hashlib.sha1(repr((domain, tuple(chain))).encode("utf-8")).hexdigest()
+    return f"{diskcache.file_label(domain)}-{digest[:16]}.mo"
+
+
+def _write_atomic(path: str, write) -> None:
+    directory = os.path.dirname(path)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            write(fp)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def export(
+    directory: str,
+    catalogs: Iterable[Tuple[str, Tuple[str, ...], Any, Sequence[Tuple[str, int]]]],
+) -> str:
+    """Write (domain, chain, translations, providers) catalogs and return the manifest path.
+
+    Catalogs that are not `exportable` are skipped.
+    """
+    os.makedirs(directory, exist_ok=True)
+    entries: List[Dict[str, Any]] = []
+    for domain, chain, translations, providers in catalogs:
+        if not exportable(translations):
+            kind = type(translations).__name__
+            logger.warning("i18n: not exporting %s catalog: domain=%s chain=%s", kind, domain, chain)
+            continue
+        catalog = translations._catalog
+        stamps = diskcache.source_stamps(getattr(translations, "files", ()))
+        if stamps is None:
+            continue
+        messages = catalog_messages(catalog, getattr(translations, "_info", {}))
+        name = _entry_name(domain, chain)
+        _write_atomic(os.path.join(directory, name), lambda fp: write_mo(fp, messages))
+        entries.append(
+            {
+                "domain": domain,
+                "chain": list(chain),
+                "file": name,
+                "providers": [list(p) for p in providers],
+                "stamps": [list(s) for s in stamps],
+            }
+        )
+    manifest = os.path.join(directory, MANIFEST_NAME)
+    data = json.dumps({"version": FORMAT_VERSION, "catalogs": entries}, indent=1).encode("utf-8")
+    _write_atomic(manifest, lambda fp: fp.write(data))
+    logger.info("i18n: exported %d catalogs to %s", len(entries), directory)
+    return manifest
+
+
+def read_manifest(path: str) -> List[Dict[str, Any]]:
+    """Return the manifest entries whose source files are unchanged since export."""
+    try:
+        with open(path, "rb") as fp:
+            data = json.load(fp)
+    except (OSError, ValueError) as exc:
+        logger.warning("i18n: unreadable shared catalog manifest %s (%s)", path, exc)
+        return []
+    if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+        return []
+    directory = os.path.dirname(path)
+    entries = []
+    for entry in data.get("catalogs", ()):
+        stamps = tuple(tuple(s) for s in entry["stamps"])
+        if diskcache.source_stamps(s[0] for s in stamps) != stamps:
+            logger.debug("i18n: shared catalog out of date: %s", entry["file"])
+            continue
+        entry["path"] = os.path.join(directory, entry["file"])
+        entries.append(entry)
+    return entries
+
@@ -0,0 +1,175 @@
+"""Opt-in hot reload of changed ``.mo`` files.
+
+`CatalogWatcher` polls the ``.mo`` files under every registered provider
+path and, when one is added, changed or removed, reloads only the cached
+(domain, chain) catalogs that can include it through `_Registry.reload`.
+With the optional ``inotify_simple`` package installed (Linux), the
+"inotify" backend wakes up on directory events instead of sleeping for the
+full interval.
+
+Files may be rewritten in place (msgfmt, Babel's ``write_mo``) or replaced
+atomically under either catalog backend: the "mmap" backend maps a private
+copy of each file, so loaded catalogs keep serving until the reload.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from logging import getLogger
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from . import locale_index
+from .registry import REGISTRY, _Registry
+
+logger = getLogger("i18n_core.watcher")
+
+WATCHER_BACKENDS = ("auto", "poll", "inotify")
+
+Stamp = Tuple[int, int]
+
+
+class CatalogWatcher:
+    """Watch provider ``.mo`` files and reload affected catalogs.
+
+    Call `start` to run in a daemon thread, or `check` to poll once.
+    """
+
+    def __init__(self, registry: _Registry = REGISTRY, interval: float = 1.0, backend: str = "auto") -> None:
+        if backend not in WATCHER_BACKENDS:
+            raise ValueError(f"Unknown watcher backend {backend!r}; expected one of {WATCHER_BACKENDS}")
+        self.registry = registry
+        self.interval = interval
+        self.backend = backend
+        self._stamps: Optional[Dict[Tuple[str, str], Dict[str, Stamp]]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify = None
+        self._watched_dirs: Dict[str, int] = {}
+
+    # Scanning ---------------------------------------------------------------
+    def _snapshot(self) -> Dict[Tuple[str, str], Dict[str, Stamp]]:
+        # (domain, provider path) -> {mo path: (mtime_ns, size)}
+        snapshot: Dict[Tuple[str, str], Dict[str, Stamp]] = {}
+        for domain in self.registry.domains():
+            for prov in self.registry.providers_for(domain):
+                index = locale_index.get_index(prov.path)
+                index.revalidate(force=True)
+                files: Dict[str, Stamp] = {}
+                for domains in index.catalogs.values():
+                    path = domains.get(domain)
+                    if path is None:
+                        continue
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    files[path] = (st.st_mtime_ns, st.st_size)
+                snapshot[(domain, prov.path)] = files
+        return snapshot
+
+    def check(self) -> int:
+        """Poll once; returns the number of catalogs reloaded."""
+        snapshot = self._snapshot()
+        previous, self._stamps = self._stamps, snapshot
+        if previous is None:
+            return 0
+        changed: Dict[str, Set[str]] = {}
+        for (domain, base), files in snapshot.items():
+            old = previous.get((domain, base), {})
+            for path in set(files) ^ set(old) | {p for p in files if p in old and files[p] != old[p]}:
+                # <base>/<locale>/LC_MESSAGES/<domain>.mo
+                changed.setdefault(domain, set()).add(os.path.basename(os.path.dirname(os.path.dirname(path))))
+        if not changed:
+            return 0
+        logger.debug("i18n: changed catalogs: %s", changed)
+        return self.registry.reload(self._affected_keys(changed))
+
+    def _affected_keys(self, changed: Dict[str, Set[str]]) -> List[Tuple[str, Tuple[str, ...]]]:
+        keys = []
+        for domain, chain in list(self.registry._cache):
+            locales = changed.get(domain)
+            if not locales:
+                continue
+            candidates = {c for lang in chain for c in locale_index._expand_lang(lang)}
+            if not chain or candidates & locales:
+                keys.append((domain, chain))
+        return keys
+
+    # Thread -----------------------------------------------------------------
+    def start(self) -> "CatalogWatcher":
+        if self._thread is not None:
+            return self
+        self._stamps = self._snapshot()
+        if self.backend in ("auto", "inotify"):
+            self._inotify = _open_inotify(required=self.backend == "inotify")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="i18n-watcher", daemon=True)
+        self._thread.start()
+        logger.info("i18n: watching translations (backend=%s)", "inotify" if self._inotify else "poll")
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watched_dirs.clear()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wait()
+            if self._stop.is_set():
+                break
+            try:
+                self.check()
+            except Exception:  # pragma: no cover
+                logger.exception("i18n: error while checking translations for changes")
+
+    def _wait(self) -> None:
+        if self._inotify is None:
+            self._stop.wait(self.interval)
+            return
+        self._watch_dirs(self._directories())
+        # Wake on the first event (or after the interval), then let the burst settle
+        if self._inotify.read(timeout=int(self.interval * 1000)):
+            self._stop.wait(0.05)
+            self._inotify.read(timeout=0)
+
+    def _directories(self) -> Iterable[str]:
+        for domain in self.registry.domains():
+            for prov in self.registry.providers_for(domain):
+                index = locale_index.get_index(prov.path)
+                yield prov.path
+                for loc in index.catalogs:
+                    yield os.path.join(prov.path, loc)
+                    yield os.path.join(prov.path, loc, "LC_MESSAGES")
+
+    def _watch_dirs(self, directories: Iterable[str]) -> None:
+        from inotify_simple import flags
+
+        mask = flags.CREATE | flags.DELETE | flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM
+        for directory in directories:
+            if directory not in self._watched_dirs and os.path.isdir(directory):
+                try:
+                    self._watched_dirs[directory] = self._inotify.add_watch(directory, mask)
+                except OSError:
+                    continue
+
+
+def _open_inotify(required: bool):
+    try:
+        from inotify_simple import INotify
+    except ImportError:
+        if required:
+            raise
+        return None
+    try:
+        return INotify()
+    except OSError:
+        if required:
+            raise
+        return None
@@ -0,0 +1,37 @@
+import locale
+import sys
+
+import pytest
+
+import i18n_core
+from i18n_core import formatting, negotiation
+from i18n_core.registry import REGISTRY, _Registry
+
+
+@pytest.fixture
+def global_registry(monkeypatch):
+    """A fresh registry standing in for the process-wide REGISTRY.
+
+    Module-level APIs (``i18n_core._``, LazyString, negotiate_locale, ...)
+    use it for the duration of the test, so providers and locales set up by
+    one test never leak into another.
+    """
+    reg = _Registry()
+    for name, module in list(sys.modules.items()):
+        if (name == "i18n_core" or name.startswith("i18n_core.")) and getattr(module, "REGISTRY", None) is REGISTRY:
+            monkeypatch.setattr(module, "REGISTRY", reg)
+    # Caches keyed by state of the registry being replaced
+    monkeypatch.setattr(formatting, "_subscribed", False)
+    formatting._formatters.clear()
+    negotiation.clear_cache()
+    # Bound module translations, and the hooks that reset them, follow the fresh registry
+    monkeypatch.setattr(i18n_core, "_bindings", {})
+    reg.on_locale_change(i18n_core._reset_bindings_for_locale)
+    reg.on_domain_change(i18n_core._reset_bindings_for_domain)
+    # i18n_core.set_locale also switches the process C locale
+    monkeypatch.setattr(i18n_core, "CURRENT_LOCALE", i18n_core.CURRENT_LOCALE)
+    c_locale = locale.setlocale(locale.LC_ALL)
+    yield reg
+    locale.setlocale(locale.LC_ALL, c_locale)
+    formatting._formatters.clear()
+    negotiation.clear_cache()
@@ -0,0 +1,32 @@
+"""Helpers to build .mo catalogs in pure Python (no external msgfmt)."""
+
+import os
+from typing import Dict, Tuple, Union
+
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo
+
+
+def build_mo(
+    locale_root: "os.PathLike[str] | str",
+    domain: str,
+    locale: str,
+    entries: Dict[str, Union[str, Tuple[str, ...]]],
+) -> str:
+    """Write ``<locale_root>/<locale>/LC_MESSAGES/<domain>.mo`` and return its path.
+
+    Plural entries are given as ``{singular: (translated_singular, translated_plural)}``;
+    the msgid_plural is ``singular + "s"``.
+    """
+    catalog = Catalog(locale=locale.split("_")[0], domain=domain)
+    for msgid, msgstr in entries.items():
+        if isinstance(msgstr, tuple):
+            catalog.add((msgid, msgid + "s"), msgstr)
+        else:
+            catalog.add(msgid, msgstr)
+    lc_dir = os.path.join(os.fspath(locale_root), locale, "LC_MESSAGES")
+    os.makedirs(lc_dir, exist_ok=True)
+    mo_path = os.path.join(lc_dir, f"{domain}.mo")
+    with open(mo_path, "wb") as fp:
+        write_mo(fp, catalog)
+    return mo_path
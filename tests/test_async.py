@@ -0,0 +1,47 @@
+"""Tests for the asyncio-native loading API."""
+
+import asyncio
+from unittest.mock import patch
+
+import i18n_core
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+def test_concurrent_requests_share_one_load(tmp_path):
+    build_mo(tmp_path, "app", "de", {"Hello": "Hallo"})
+    reg = _Registry()
+    reg.register_domain("app", str(tmp_path), source="test")
+    reg.set_locale("de_DE")
+    real_load = reg._load_domain
+    calls = []
+
+    def slow_load(*key):
+        calls.append(key)
+        return real_load(*key)
+
+    async def main():
+        with patch.object(reg, "_load_domain", side_effect=slow_load):
+            return await asyncio.gather(*(reg.aget_domain_translations("app") for _ in range(10)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(t is results[0] for t in results)
+    assert results[0].gettext("Hello") == "Hallo"
+    assert reg.get_domain_translations("app") is results[0]
+
+
+def test_aset_locale_loads_domains_in_use_before_switching(tmp_path, global_registry):
+    build_mo(tmp_path, "async_probe", "en_US", {"Hello": "Hello"})
+    build_mo(tmp_path, "async_probe", "de", {"Hello": "Hallo"})
+    global_registry.register_domain("async_probe", str(tmp_path), priority=100, source="test")
+    i18n_core.set_locale("en_US")
+    global_registry.get_domain_translations("async_probe")
+
+    async def main():
+        return await i18n_core.aset_locale("de_DE")
+
+    assert asyncio.run(main()) == "de_DE"
+    with patch.object(global_registry, "_load_domain", side_effect=AssertionError):
+        assert global_registry.get_domain_translations("async_probe").gettext("Hello") == "Hallo"
@@ -0,0 +1,41 @@
+"""Tests for the batch and streaming translation API."""
+
+import pytest
+
+import i18n_core
+
+from .mo_helpers import build_mo
+
+
+@pytest.fixture
+def batch_domain(tmp_path, global_registry):
+    build_mo(tmp_path, "batch_probe", "de", {"Name": "Name-DE", "Size": "Größe", "file": ("Datei", "Dateien")})
+    global_registry.register_domain("batch_probe", str(tmp_path), priority=100, source="test")
+    with i18n_core.use_locale("de_DE"):
+        yield "batch_probe"
+
+
+def test_gettext_many(batch_domain):
+    assert i18n_core.gettext_many(["Name", "Size", "Other"], domain=batch_domain) == ["Name-DE", "Größe", "Other"]
+
+
+def test_gettext_many_resolves_caller_domain(batch_domain, global_registry):
+    global_registry.set_module_domain(__name__, batch_domain)
+    assert i18n_core.gettext_many(["Size"]) == ["Größe"]
+
+
+def test_ngettext_many(batch_domain):
+    pairs = [("file", "files")] * 3
+    assert i18n_core.ngettext_many(pairs, [1, 2, 0], domain=batch_domain) == ["Datei", "Dateien", "Dateien"]
+    with pytest.raises(ValueError):
+        i18n_core.ngettext_many(pairs, [1], domain=batch_domain)
+
+
+def test_streaming_binds_catalog_at_call_time(batch_domain):
+    stream = i18n_core.iter_gettext(iter(["Name", "Size"]), domain=batch_domain)
+    records = i18n_core.translate_records(
+        [{"label": "Size", "value": 3}, {"label": 7}], fields=["label"], domain=batch_domain
+    )
+    with i18n_core.use_locale("en_US"):
+        assert list(stream) == ["Name-DE", "Größe"]
+        assert list(records) == [{"label": "Größe", "value": 3}, {"label": 7}]
@@ -0,0 +1,68 @@
+"""Tests for call-site domain resolution and its per-code-object cache."""
+
+import sys
+import types
+
+import pytest
+
+from i18n_core.registry import get_calling_module_name
+
+
+@pytest.fixture
+def probe_module(global_registry):
+    mod = types.ModuleType("resolve_probe")
+    exec(
+        "import i18n_core\n"
+        "def probe():\n"
+        "    return i18n_core._resolve_domain_for_call()\n"
+        "def caller_name():\n"
+        "    return i18n_core.get_calling_module_name()\n",
+        mod.__dict__,
+    )
+    sys.modules[mod.__name__] = mod
+    yield mod
+    sys.modules.pop(mod.__name__, None)
+
+
+def test_calling_module_name_skips_i18n_core_frames(probe_module):
+    assert probe_module.caller_name() == "resolve_probe"
+    assert get_calling_module_name() == __name__
+
+
+def test_call_site_is_cached(probe_module, global_registry):
+    global_registry.set_module_domain("resolve_probe", "probe_domain")
+    assert probe_module.probe() == "probe_domain"
+    assert global_registry.domain_for_code(probe_module.probe.__code__) == "probe_domain"
+
+
+def test_set_module_domain_invalidates_cache(probe_module, global_registry):
+    global_registry.set_module_domain("resolve_probe", "first")
+    assert probe_module.probe() == "first"
+    global_registry.set_module_domain("resolve_probe", "second")
+    assert global_registry.domain_for_code(probe_module.probe.__code__) is None
+    assert probe_module.probe() == "second"
+
+
+def test_register_domain_invalidates_cache(probe_module, tmp_path, global_registry):
+    global_registry.set_module_domain("resolve_probe", "probe_domain")
+    probe_module.probe()
+    global_registry.register_domain("unrelated_domain", str(tmp_path), source="test")
+    assert global_registry.domain_for_code(probe_module.probe.__code__) is None
+
+
+def test_resolution_racing_a_mapping_change_is_not_cached(probe_module, global_registry):
+    code = probe_module.probe.__code__
+    generation = global_registry.generation
+    global_registry.set_module_domain("resolve_probe", "changed")
+    global_registry.remember_code_domain(code, "stale", generation)
+    assert global_registry.domain_for_code(code) is None
+
+
+def test_code_domain_cache_is_bounded(global_registry, monkeypatch):
+    from i18n_core import registry
+
+    monkeypatch.setattr(registry, "CODE_DOMAIN_CACHE_SIZE", 2)
+    codes = [compile(f"x = {i}", "<probe>", "exec") for i in range(3)]
+    for code in codes:
+        global_registry.remember_code_domain(code, "d", global_registry.generation)
+    assert [global_registry.domain_for_code(c) for c in codes] == [None, "d", "d"]
@@ -0,0 +1,78 @@
+"""Tests for per-context locale overrides."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import i18n_core
+from i18n_core import LazyString
+
+from .mo_helpers import build_mo
+
+
+@pytest.fixture
+def ctx_domain(tmp_path, global_registry):
+    build_mo(tmp_path, "ctx_probe", "en_US", {"Hello": "Hello"})
+    build_mo(tmp_path, "ctx_probe", "de", {"Hello": "Hallo"})
+    build_mo(tmp_path, "ctx_probe", "fr", {"Hello": "Bonjour"})
+    global_registry.register_domain("ctx_probe", str(tmp_path), priority=100, source="test")
+    i18n_core.set_locale("en_US")
+    return "ctx_probe"
+
+
+def _hello(domain):
+    return i18n_core.REGISTRY.get_domain_translations(domain).gettext("Hello")
+
+
+def test_override_is_scoped_and_nests(ctx_domain):
+    with i18n_core.use_locale("de_DE"):
+        assert i18n_core.REGISTRY.get_locale() == "de_DE"
+        assert _hello(ctx_domain) == "Hallo"
+        with i18n_core.use_locale("fr"):
+            assert _hello(ctx_domain) == "Bonjour"
+        assert _hello(ctx_domain) == "Hallo"
+    assert i18n_core.REGISTRY.get_locale() == "en_US"
+    assert _hello(ctx_domain) == "Hello"
+
+
+def test_threads_keep_their_own_locale(ctx_domain):
+    results = {}
+    barrier = threading.Barrier(2)
+
+    def worker(locale_id):
+        with i18n_core.use_locale(locale_id):
+            barrier.wait()
+            results[locale_id] = [_hello(ctx_domain) for _ in range(100)]
+
+    threads = [threading.Thread(target=worker, args=(loc,)) for loc in ("de_DE", "fr_FR")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert set(results["de_DE"]) == {"Hallo"}
+    assert set(results["fr_FR"]) == {"Bonjour"}
+
+
+def test_asyncio_tasks_keep_their_own_locale(ctx_domain):
+    async def render(locale_id):
+        async with i18n_core.use_locale(locale_id):
+            await asyncio.sleep(0)
+            return _hello(ctx_domain)
+
+    async def main():
+        return await asyncio.gather(render("de_DE"), render("fr_FR"), render("en_US"))
+
+    assert asyncio.run(main()) == ["Hallo", "Bonjour", "Hello"]
+
+
+def test_bound_modules_and_lazy_strings_follow_override(ctx_domain):
+    module = SimpleNamespace(__name__="ctx_probe.mod", __file__="/fake/ctx_probe/mod.py")
+    i18n_core.install_translation_into_module(module, domain=ctx_domain)
+    lazy = LazyString("Hello", domain=ctx_domain)
+    assert module._("Hello") == "Hello" and str(lazy) == "Hello"
+    with i18n_core.use_locale("de_DE"):
+        assert module._("Hello") == "Hallo"
+        assert str(lazy) == "Hallo"
+    assert module._("Hello") == "Hello" and str(lazy) == "Hello"
@@ -0,0 +1,69 @@
+"""Tests for the on-disk cache of merged catalogs."""
+
+import os
+
+from i18n_core import diskcache
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+def _registry(locale_root, cache_dir):
+    reg = _Registry()
+    reg.set_disk_cache_dir(str(cache_dir))
+    reg.register_domain("app", str(locale_root / "lib"), priority=50, source="lib")
+    reg.register_domain("app", str(locale_root / "app"), priority=100, source="app")
+    reg.set_locale("de_DE")
+    return reg
+
+
+def test_second_start_loads_merged_catalog_from_cache(tmp_path, monkeypatch):
+    build_mo(tmp_path / "lib", "app", "de", {"Hello": "Hallo (lib)", "Bye": "Tschüss"})
+    build_mo(tmp_path / "app", "app", "de", {"Hello": "Hallo (app)"})
+    cache_dir = tmp_path / "cache"
+
+    first = _registry(tmp_path, cache_dir).get_domain_translations("app")
+    assert first.gettext("Hello") == "Hallo (app)"
+    assert len(os.listdir(cache_dir)) == 1
+
+    hits = []
+    real_load = diskcache.load
+
+    def counting_load(*args, **kwargs):
+        result = real_load(*args, **kwargs)
+        hits.append(result is not None)
+        return result
+
+    monkeypatch.setattr(diskcache, "load", counting_load)
+    second = _registry(tmp_path, cache_dir).get_domain_translations("app")
+    assert hits == [True]
+    assert second.gettext("Hello") == "Hallo (app)"
+    assert second.gettext("Bye") == "Tschüss"
+
+
+def test_changed_source_invalidates_entry(tmp_path):
+    mo_path = build_mo(tmp_path / "app", "app", "de", {"Hello": "Hallo"})
+    build_mo(tmp_path / "lib", "app", "de", {})
+    cache_dir = tmp_path / "cache"
+    assert _registry(tmp_path, cache_dir).get_domain_translations("app").gettext("Hello") == "Hallo"
+
+    build_mo(tmp_path / "app", "app", "de", {"Hello": "Servus, Welt"})
+    st = os.stat(mo_path)
+    os.utime(mo_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _registry(tmp_path, cache_dir).get_domain_translations("app").gettext("Hello") == "Servus, Welt"
+
+
+def test_unwritable_cache_dir_falls_back(tmp_path):
+    build_mo(tmp_path / "app", "app", "de", {"Hello": "Hallo"})
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    reg = _registry(tmp_path, blocker / "cache")
+    assert reg.get_domain_translations("app").gettext("Hello") == "Hallo"
+
+
+def test_entry_path_stays_inside_cache_dir(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    for domain in ("../../etc/evil", "a/b", "..", "c:\\x"):
+        path = diskcache.entry_path(cache_dir, domain, ("de",), [])
+        assert os.path.dirname(path) == cache_dir
+    assert diskcache.entry_path(cache_dir, "a/b", (), []) != diskcache.entry_path(cache_dir, "a_b", (), [])
@@ -129,8 +129,8 @@ def test_available_translations_lists_locales(tmp_path):
     build_mo(locale_root, "libC", "en_US", {"Hello": "C-EN"})
     build_mo(locale_root, "libC", "de_DE", {"Hello": "C-DE"})
 
-    # Register implicitly by importing and calling _ once
     from libC import foo  # noqa: F401
+    i18n_core.install_module_translation("libC", module=sys.modules["libC.foo"])
     locs = list(i18n_core.get_available_translations("libC"))
     assert "en_US" in locs
     assert "de_DE" in locs
@@ -0,0 +1,35 @@
+"""Tests for locale-aware timestamp formatting."""
+
+import datetime
+
+import i18n_core
+from i18n_core import formatting
+
+OLD = datetime.datetime(2001, 2, 3, 4, 5, 6)
+
+
+def test_format_follows_active_locale():
+    with i18n_core.use_locale("de_DE"):
+        assert i18n_core.format_timestamp(OLD) == "03.02.2001, 04:05:06"
+    with i18n_core.use_locale("fr_FR"):
+        assert i18n_core.format_timestamp(OLD).startswith("3 févr. 2001")
+
+
+def test_today_shows_time_only():
+    now = datetime.datetime.now().replace(hour=13, minute=14, second=15, microsecond=0)
+    with i18n_core.use_locale("de_DE"):
+        assert i18n_core.format_timestamp(now) == "13:14:15"
+        assert i18n_core.format_timestamps([now, OLD.timestamp()]) == ["13:14:15", "03.02.2001, 04:05:06"]
+
+
+def test_formatters_are_cached_until_locale_changes():
+    first = formatting.get_timestamp_formatter("de_DE")
+    assert formatting.get_timestamp_formatter("de_DE") is first
+    i18n_core.REGISTRY.set_locale(i18n_core.REGISTRY.get_locale())
+    assert formatting.get_timestamp_formatter("de_DE") is not first
+
+
+def test_unknown_locale_falls_back_to_c_locale():
+    assert formatting.get_timestamp_formatter("xx_YY") is None
+    with i18n_core.use_locale("xx_YY"):
+        assert i18n_core.format_timestamp(OLD) == i18n_core._format_timestamp_c_locale(OLD)
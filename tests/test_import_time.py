@@ -0,0 +1,68 @@
+"""Import-time regression checks: `import i18n_core` must stay cheap."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous on purpose (includes bytecode compilation when no .pyc exists);
+# the point is to catch heavy dependencies creeping back into the import.
+IMPORT_BUDGET_SECONDS = 0.25
+
+DEFERRED_MODULES = ("babel", "babel.core", "babel.support", "ctypes", "platform_utils", "asyncio")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import i18n_core
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": sorted(m for m in %r if m in sys.modules),
+    "generation": i18n_core.REGISTRY.generation,
+    "chain": list(i18n_core.REGISTRY.active_chain()),
+}))
+"""
+
+
+def _probe():
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE % (DEFERRED_MODULES,)],
+        env=env,
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return _probe()
+
+
+def test_heavy_dependencies_are_deferred(probe):
+    assert probe["modules"] == []
+
+
+def test_import_does_not_switch_locale(probe):
+    # The registry starts on the default chain without a set_locale() call
+    assert probe["generation"] == 0
+    assert probe["chain"] == ["en_US", "en"]
+
+
+def test_import_within_budget():
+    best = min(_probe()["elapsed"] for _ in range(3))
+    assert best < IMPORT_BUDGET_SECONDS
+
+
+def test_active_translation_is_served_lazily():
+    import i18n_core
+
+    assert i18n_core.active_translation is i18n_core.active_translation
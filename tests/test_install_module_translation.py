@@ -59,3 +59,34 @@ class TestInstallModuleTranslation:
         assert callable(getattr(self.mock_module, "_"))
         assert callable(getattr(self.mock_module, "__"))
         assert callable(getattr(self.mock_module, "ngettext"))
+
+
+class TestBoundModuleTranslation:
+    def setup_method(self):
+        self.module = SimpleNamespace(__name__="bound_probe.mod", __file__="/fake/bound_probe/mod.py")
+
+    def test_bound_module_skips_registry_until_locale_change(self, tmp_path, global_registry):
+        from .mo_helpers import build_mo
+
+        build_mo(tmp_path, "bound_probe", "en_US", {"Hello": "Hi"})
+        build_mo(tmp_path, "bound_probe", "de", {"Hello": "Hallo"})
+        i18n_core.install_module_translation(domain="bound_probe", module=self.module, locale_path=str(tmp_path))
+        i18n_core.set_locale("en_US")
+        assert self.module._("Hello") == "Hi"
+
+        with patch.object(global_registry, "get_domain_translations", side_effect=AssertionError):
+            assert self.module._("Hello") == "Hi"
+            assert self.module.ngettext("Hello", "Hellos", 2) == "Hellos"
+
+        i18n_core.set_locale("de_DE")
+        assert self.module._("Hello") == "Hallo"
+
+    def test_provider_registration_rebinds(self, tmp_path, global_registry):
+        from .mo_helpers import build_mo
+
+        i18n_core.install_module_translation(domain="bound_probe2", module=self.module, locale_path=str(tmp_path / "a"))
+        i18n_core.set_locale("en_US")
+        assert self.module._("Hello") == "Hello"
+        build_mo(tmp_path / "b", "bound_probe2", "en_US", {"Hello": "Hi there"})
+        global_registry.register_domain("bound_probe2", str(tmp_path / "b"), priority=100, source="test")
+        assert self.module._("Hello") == "Hi there"
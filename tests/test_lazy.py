@@ -0,0 +1,52 @@
+"""Tests for generation-cached lazy strings."""
+
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+import i18n_core
+from i18n_core import LazyString
+
+from .mo_helpers import build_mo
+
+
+@pytest.fixture
+def lazy_domain(tmp_path, global_registry):
+    build_mo(tmp_path, "lazy_probe", "en_US", {"Open": "Open file"})
+    build_mo(tmp_path, "lazy_probe", "de", {"Open": "Öffnen"})
+    global_registry.register_domain("lazy_probe", str(tmp_path), priority=100, source="test")
+    i18n_core.set_locale("en_US")
+    return "lazy_probe"
+
+
+def test_value_is_cached_until_generation_changes(lazy_domain, global_registry):
+    s = LazyString("Open", domain=lazy_domain)
+    assert str(s) == "Open file"
+    with patch.object(global_registry, "get_domain_translations", side_effect=AssertionError):
+        assert s == "Open file"
+        assert hash(s) == hash("Open file")
+    i18n_core.set_locale("de_DE")
+    assert str(s) == "Öffnen"
+
+
+def test_behaves_like_str(lazy_domain):
+    s = LazyString("Open", domain=lazy_domain)
+    assert s.upper() == "OPEN FILE"
+    assert s + "!" == "Open file!"
+    assert "> " + s == "> Open file"
+    assert f"[{s:>10}]" == "[ Open file]"
+    assert len(s) == 9 and "file" in s and s[0] == "O"
+    assert sorted([s, "A"]) == ["A", s]
+
+
+def test_dynamic_lazy_remembers_calling_module(global_registry):
+    s = i18n_core.__("Untranslated")
+    assert isinstance(s, LazyString)
+    assert s._module == __name__
+    assert str(s) == "Untranslated"
+
+
+def test_pickle_round_trip(lazy_domain):
+    s = pickle.loads(pickle.dumps(LazyString("Open", domain=lazy_domain)))
+    assert str(s) == "Open file"
@@ -0,0 +1,84 @@
+"""Tests for the cached locale-directory index."""
+
+import gettext
+import os
+import sys
+from unittest.mock import patch
+
+import i18n_core
+from i18n_core import locale_index
+
+from .mo_helpers import build_mo
+
+
+def _tree(root):
+    build_mo(root, "app", "de", {"Hello": "Hallo"})
+    build_mo(root, "app", "pt_BR", {"Hello": "Olá"})
+    build_mo(root, "other", "fr", {"Hello": "Bonjour"})
+    return str(root)
+
+
+def test_find_matches_gettext(tmp_path):
+    path = _tree(tmp_path)
+    index = locale_index.LocaleDirIndex(path)
+    for chain in (["de_DE", "de"], ["pt_BR", "pt"], ["pt_PT", "pt"], ["fr_FR", "fr"], ["en_US", "en"]):
+        for domain in ("app", "other", "missing"):
+            assert index.find(domain, chain) == gettext.find(domain, path, chain)
+
+
+def test_lookups_do_not_touch_the_disk(tmp_path):
+    path = _tree(tmp_path)
+    locale_index.invalidate(path)
+    index = locale_index.get_index(path)
+    with patch("os.stat", side_effect=AssertionError), patch("os.scandir", side_effect=AssertionError):
+        assert locale_index.get_index(path) is index
+        assert index.find("app", ["es_ES", "es"]) is None
+        assert sorted(index.locales_for("app")) == ["de", "pt_BR"]
+
+
+def test_revalidate_picks_up_new_catalogs(tmp_path):
+    path = _tree(tmp_path)
+    index = locale_index.LocaleDirIndex(path)
+    build_mo(tmp_path, "app", "es", {"Hello": "Hola"})
+    os.utime(tmp_path, ns=(0, 1))
+    index.revalidate(force=True)
+    assert index.find("app", ["es_ES", "es"]) == os.path.join(path, "es", "LC_MESSAGES", "app.mo")
+
+
+def test_available_translations_use_index(tmp_path):
+    path = _tree(tmp_path)
+    locs = list(i18n_core.get_available_translations("app", locale_path=path))
+    assert sorted(locs) == ["de", "en_US", "pt_BR"]
+
+
+def test_listing_translations_does_not_register_providers(global_registry, monkeypatch, tmp_path):
+    import types
+
+    build_mo(tmp_path / "listing_probe" / "locale", "listing_probe", "de", {"Hello": "Hallo"})
+    module = types.ModuleType("listing_probe")
+    module.__file__ = str(tmp_path / "listing_probe" / "__init__.py")
+    monkeypatch.setitem(sys.modules, "listing_probe", module)
+    generation = global_registry.generation
+    assert list(i18n_core.get_available_translations("listing_probe")) == ["en_US"]
+    assert global_registry.providers_for("listing_probe") == []
+    assert global_registry.generation == generation
+
+
+def test_lowercase_messages_dir_is_listed_but_not_loaded(tmp_path):
+    path = _tree(tmp_path)
+    mo = build_mo(tmp_path, "app", "es", {"Hello": "Hola"})
+    os.renames(os.path.dirname(mo), os.path.join(path, "es", "lc_messages"))
+    index = locale_index.LocaleDirIndex(path)
+    assert sorted(index.locales_for("app")) == ["de", "es", "pt_BR"]
+    assert index.find("app", ["es_ES", "es"]) is None
+    assert "es" not in index.catalogs
+
+
+def test_find_ignores_case_on_case_insensitive_platforms(monkeypatch, tmp_path):
+    mo = build_mo(tmp_path, "app", "pt_br", {"Hello": "Olá"})
+    monkeypatch.setattr(locale_index, "_CASE_INSENSITIVE", False)
+    assert locale_index.LocaleDirIndex(str(tmp_path)).find("app", ["pt_BR", "pt"]) is None
+    monkeypatch.setattr(locale_index, "_CASE_INSENSITIVE", True)
+    assert locale_index.LocaleDirIndex(str(tmp_path)).find("app", ["pt_BR", "pt"]) == mo
+    manifest_index = locale_index.LocaleDirIndex.from_catalogs(str(tmp_path), {"zh_cn": {"app": mo}})
+    assert manifest_index.find("app", ["zh_CN"]) == mo
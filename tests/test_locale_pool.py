@@ -0,0 +1,55 @@
+"""Tests for the interned Locale pool behind locale_from_locale_id."""
+
+import babel.core
+import pytest
+
+import i18n_core
+from i18n_core import locale_pool
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    locale_pool.clear()
+    yield
+    locale_pool.clear()
+
+
+def test_locales_are_interned_by_normalized_id():
+    de = i18n_core.locale_from_locale_id("de_DE")
+    assert i18n_core.locale_from_locale_id("de-de") is de
+    assert (de.language, de.territory) == ("de", "DE")
+    assert i18n_core.locale_from_locale_id("fr").language == "fr"
+
+
+def test_unknown_locales_are_cached(monkeypatch):
+    with pytest.raises(babel.core.UnknownLocaleError):
+        i18n_core.locale_from_locale_id("xx_YY")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Locale built again")
+
+    monkeypatch.setattr(babel.core, "Locale", fail)
+    with pytest.raises(babel.core.UnknownLocaleError):
+        i18n_core.locale_from_locale_id("xx_YY")
+
+
+def test_pool_is_bounded(monkeypatch):
+    monkeypatch.setattr(locale_pool, "LOCALE_POOL_SIZE", 2)
+    first = i18n_core.locale_from_locale_id("de")
+    i18n_core.locale_from_locale_id("fr")
+    i18n_core.locale_from_locale_id("it")
+    assert i18n_core.locale_from_locale_id("de") is not first
+
+
+def test_available_locales_round_trip_to_their_directories(tmp_path, global_registry):
+    from .mo_helpers import build_mo
+
+    installed = {"de_DE", "pt_BR", "zh_CN"}
+    for loc in installed:
+        build_mo(tmp_path, "pool_probe", loc, {"Hello": f"Hello-{loc}"})
+    global_registry.register_domain("pool_probe", str(tmp_path), source="test")
+    listed = [str(loc) for loc in i18n_core.get_available_locales("pool_probe")]
+    assert {"de_DE", "pt_BR"} <= set(listed)
+    for locale_id in listed:
+        global_registry.set_locale(locale_id)
+        assert global_registry.active_chain()[0] in installed | {"en_US"}
@@ -0,0 +1,78 @@
+"""Tests for the build-time domain manifest."""
+
+import os
+
+import pytest
+
+import i18n_core
+from i18n_core import locale_index, manifest, registry
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+@pytest.fixture
+def built(tmp_path, monkeypatch):
+    pkg = tmp_path / "src" / "manpkg"
+    (pkg / "sub").mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "sub" / "__init__.py").write_text("")
+    build_mo(pkg / "locale", "manpkg", "de", {"Hello": "Hallo"})
+    build_mo(tmp_path / "app_locale", "manapp", "fr", {"Hello": "Bonjour"})
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    output = tmp_path / "dist" / "i18n-manifest.json"
+    output.parent.mkdir()
+    manifest.main([str(output), "--app", f"manapp={tmp_path / 'app_locale'}", "--package", "manpkg"])
+    yield output
+    # load_manifest seeds the process-wide locale indexes
+    locale_index.invalidate(str(pkg / "locale"))
+    locale_index.invalidate(str(tmp_path / "app_locale"))
+
+
+def test_manifest_records_domains_and_locales(built, tmp_path):
+    data = manifest.read(str(built))
+    assert data["modules"] == {"manpkg": "manpkg"}
+    assert data["default_domain"] == "manapp"
+    (entry,) = data["domains"]["manpkg"]
+    assert entry["path"] == str(tmp_path / "src" / "manpkg" / "locale")
+    assert list(entry["catalogs"]) == ["de"]
+
+
+def test_loaded_manifest_needs_no_filesystem_probing(built, monkeypatch):
+    reg = _Registry()
+    assert reg.load_manifest(str(built)) == 2
+    assert reg.get_default_domain() == "manapp"
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("filesystem probed")
+
+    monkeypatch.setattr(os, "scandir", forbidden)
+    monkeypatch.setattr(os.path, "isdir", forbidden)
+    monkeypatch.setattr(registry, "REGISTRY", reg)
+    assert registry.ensure_inferred_provider("manpkg.sub.mod", None) == "manpkg"
+    assert reg.manifest_locale_path("manpkg.sub") == reg.providers_for("manpkg")[0].path
+    reg.set_locale("de_DE")
+    assert reg.get_domain_translations("manpkg").gettext("Hello") == "Hallo"
+    reg.set_locale("fr_FR")
+    assert reg.get_domain_translations("manapp").gettext("Hello") == "Bonjour"
+
+
+def test_unsupported_manifest_is_rejected(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('{"version": 0}')
+    with pytest.raises(ValueError):
+        _Registry().load_manifest(str(path))
+
+
+def test_finalize_does_not_register_the_manifest_app_twice(built, tmp_path, global_registry, monkeypatch):
+    app_locale = str(tmp_path / "app_locale")
+    i18n_core.finalize_i18n(
+        "fr_FR", app_domain="manapp", app_locale_path=app_locale, install_into_builtins=False, manifest=str(built)
+    )
+    assert [p.source for p in global_registry.providers_for("manapp")] == ["manifest"]
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("filesystem probed")
+
+    monkeypatch.setattr(os, "scandir", forbidden)
+    assert global_registry.get_domain_translations("manapp").gettext("Hello") == "Bonjour"
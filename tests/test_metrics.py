@@ -0,0 +1,87 @@
+"""Tests for registry metrics and load callbacks."""
+
+import types
+
+import pytest
+
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+@pytest.fixture
+def registry(tmp_path):
+    build_mo(tmp_path / "lib", "app", "de", {"Hello": "Hallo (lib)"})
+    build_mo(tmp_path / "app", "app", "de", {"Hello": "Hallo"})
+    reg = _Registry()
+    reg.register_domain("app", str(tmp_path / "lib"), priority=50, source="lib")
+    reg.register_domain("app", str(tmp_path / "app"), priority=100, source="app")
+    reg.set_locale("de_DE")
+    return reg
+
+
+def test_counts_hits_misses_loads_and_merges(registry, tmp_path):
+    for _ in range(3):
+        registry.get_domain_translations("app")
+    stats = registry.stats()
+    assert stats["enabled"] is True
+    assert stats["domains"]["app"]["misses"] == 1
+    assert stats["domains"]["app"]["hits"] == 2
+    assert stats["domains"]["app"]["merge_seconds"] >= 0.0
+    assert sorted(p["path"] for p in stats["providers"]) == sorted([str(tmp_path / "lib"), str(tmp_path / "app")])
+    assert all(p["loads"] == 1 for p in stats["providers"])
+
+
+def test_load_callbacks(registry):
+    events = []
+    unsubscribe = registry.on_load(events.append)
+    registry.get_domain_translations("app")
+    unsubscribe()
+    registry.set_locale("fr_FR")
+    registry.get_domain_translations("app")
+    assert len(events) == 1
+    assert events[0].domain == "app" and events[0].chain == ("de_DE", "de")
+    assert len(events[0].files) == 2 and not events[0].from_disk_cache
+
+
+def test_disabled_stats_collect_nothing(registry):
+    registry.enable_stats(False)
+    registry.get_domain_translations("app")
+    assert registry.stats() == {"enabled": False, "domains": {}, "providers": [], "resolution": {"count": 0, "seconds": 0.0}}
+    registry.enable_stats()
+    registry.get_domain_translations("app")
+    assert registry.stats()["domains"]["app"]["hits"] == 1
+
+
+def test_missing_msgids_and_resolution_are_recorded(global_registry):
+    mod = types.ModuleType("metrics_probe")
+    exec("import i18n_core\ndef t(msg):\n    return i18n_core._(msg)\n", mod.__dict__)
+    global_registry.set_module_domain("metrics_probe", "metrics_probe")
+    assert mod.t("Nowhere to be found") == "Nowhere to be found"
+    stats = global_registry.stats()
+    assert stats["domains"]["metrics_probe"]["missing"] == 1
+    assert stats["domains"]["metrics_probe"]["missing_msgids"] == ["Nowhere to be found"]
+    assert stats["resolution"]["count"] >= 1
+
+
+def test_snapshot_while_lookups_record():
+    import threading
+
+    from i18n_core.metrics import RegistryStats
+
+    stats = RegistryStats()
+
+    def record():
+        for i in range(20000):
+            stats.hits[f"d{i}"] += 1
+            stats.record_missing(f"d{i % 7}", f"msg{i}")
+            stats.record_load(f"d{i % 11}", f"/path/{i}", 0.0)
+
+    writers = [threading.Thread(target=record) for _ in range(2)]
+    for t in writers:
+        t.start()
+    while any(t.is_alive() for t in writers):
+        assert "domains" in stats.snapshot()
+    for t in writers:
+        t.join()
+    assert stats.snapshot()["domains"]["d19999"]["hits"] >= 1
@@ -0,0 +1,112 @@
+"""Tests for the memory-mapped .mo catalog backend."""
+
+import os
+
+import pytest
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo as babel_write_mo
+
+from i18n_core.mofile import MappedTranslations, write_mo
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+HEADER = (
+    b"Content-Type: text/plain; charset=UTF-8\n"
+    b"Plural-Forms: nplurals=3; plural=(n==1 ? 0 : n==2 ? 1 : 2);\n"
+)
+
+
+@pytest.fixture
+def hashed_mo(tmp_path):
+    path = str(tmp_path / "hashed.mo")
+    messages = {
+        b"": HEADER,
+        b"Hello": "Grüß dich".encode("utf-8"),
+        b"file\0files": b"one file\0two files\0many files",
+        b"menu\x04Open": b"Open (menu)",
+    }
+    messages.update({f"key{i}".encode(): f"value{i}".encode() for i in range(200)})
+    with open(path, "wb") as fp:
+        write_mo(fp, messages)
+    return path
+
+
+def test_hashed_lookups(hashed_mo):
+    t = MappedTranslations(hashed_mo)
+    assert t._hash_size > 0
+    assert t.gettext("Hello") == "Grüß dich"
+    assert t.gettext("Missing") == "Missing"
+    assert t.ngettext("file", "files", 1) == "one file"
+    assert t.ngettext("file", "files", 2) == "two files"
+    assert t.ngettext("file", "files", 7) == "many files"
+    assert t.pgettext("menu", "Open") == "Open (menu)"
+    assert t.pgettext("other", "Open") == "Open"
+    assert all(t.gettext(f"key{i}") == f"value{i}" for i in range(200))
+    assert t.entry_count == 203
+    t.close()
+
+
+def test_unhashed_babel_file_matches_translations(tmp_path):
+    catalog = Catalog(locale="de", domain="app")
+    catalog.add("Hello", "Hallo")
+    catalog.add(("item", "items"), ("Eintrag", "Einträge"))
+    catalog.add("Open", "Öffnen (Datei)", context="file")
+    catalog.add("Zebra", "Zebra-DE")
+    path = str(tmp_path / "app.mo")
+    with open(path, "wb") as fp:
+        babel_write_mo(fp, catalog)
+    t = MappedTranslations(path, domain="app")
+    assert t._hash_size == 0
+    assert t.gettext("Hello") == "Hallo"
+    assert t.gettext("Zebra") == "Zebra-DE"
+    assert t.ngettext("item", "items", 1) == "Eintrag"
+    assert t.ngettext("item", "items", 3) == "Einträge"
+    assert t.pgettext("file", "Open") == "Öffnen (Datei)"
+    assert t.gettext("nope") == "nope"
+    t.close()
+
+
+def test_bad_magic_raises(tmp_path):
+    path = tmp_path / "broken.mo"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(OSError):
+        MappedTranslations(os.fspath(path))
+
+
+def test_rewriting_a_loaded_file_in_place(hashed_mo):
+    t = MappedTranslations(hashed_mo)
+    # msgfmt and Babel truncate and rewrite the file; a shared mapping would fault (SIGBUS)
+    with open(hashed_mo, "wb") as fp:
+        write_mo(fp, {b"": HEADER, b"Hello": b"Hi"})
+    assert t.gettext("Hello") == "Grüß dich"
+    assert t.gettext("key199") == "value199"
+    assert MappedTranslations(hashed_mo).gettext("Hello") == "Hi"
+
+
+def test_truncated_file_raises(hashed_mo):
+    with open(hashed_mo, "wb") as fp:
+        fp.write(b"\xde\x12\x04\x95")
+    with pytest.raises(OSError):
+        MappedTranslations(hashed_mo)
+
+
+def test_registry_mmap_backend_overlays_by_priority(tmp_path):
+    lib_root, app_root = tmp_path / "lib", tmp_path / "app"
+    build_mo(lib_root, "shared", "de", {"Hello": "Hallo (lib)", "Bye": "Tschüss (lib)"})
+    build_mo(app_root, "shared", "de", {"Hello": "Hallo (app)"})
+    reg = _Registry()
+    reg.set_catalog_backend("mmap")
+    reg.register_domain("shared", str(lib_root), priority=50, source="lib")
+    reg.register_domain("shared", str(app_root), priority=100, source="app")
+    reg.set_locale("de_DE")
+    t = reg.get_domain_translations("shared")
+    assert isinstance(t, MappedTranslations)
+    assert t.gettext("Hello") == "Hallo (app)"
+    assert t.gettext("Bye") == "Tschüss (lib)"
+    assert t.gettext("Untranslated") == "Untranslated"
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        _Registry().set_catalog_backend("sqlite")
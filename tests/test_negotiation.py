@@ -0,0 +1,47 @@
+"""Tests for Accept-Language negotiation."""
+
+import pytest
+
+import i18n_core
+from i18n_core import negotiation
+
+from .mo_helpers import build_mo
+
+
+@pytest.fixture
+def web_domain(tmp_path, global_registry):
+    for loc in ("de", "fr_CA", "pt_BR"):
+        build_mo(tmp_path, "web_probe", loc, {"Hello": f"Hello-{loc}"})
+    global_registry.register_domain("web_probe", str(tmp_path), source="test")
+    return "web_probe"
+
+
+def test_parse_accept_language_orders_by_quality():
+    header = "fr-CH, fr;q=0.9, en;q=0.8, de;q=0.7, *;q=0.5, it;q=0"
+    assert negotiation.parse_accept_language(header) == ["fr-CH", "fr", "en", "de"]
+
+
+def test_negotiate_header(web_domain):
+    assert i18n_core.negotiate_locale("de-AT,de;q=0.9,en;q=0.5", web_domain) == ("de", "de_DE", "en_US", "en")
+    # Same language in another region is still a match
+    assert i18n_core.negotiate_locale("fr-FR", web_domain) == ("fr_CA", "fr")
+    assert i18n_core.negotiate_locale(["pt-br"], web_domain) == ("pt_BR", "pt")
+
+
+def test_no_match_uses_default(web_domain):
+    assert i18n_core.negotiate_locale("ja, ko", web_domain) == ()
+    assert i18n_core.negotiate_locale("ja", web_domain, default="de") == ("de", "de_DE")
+
+
+def test_results_are_cached_until_locales_change(web_domain, tmp_path, global_registry):
+    first = i18n_core.negotiate_locale("it, fr", web_domain)
+    assert i18n_core.negotiate_locale("it, fr", web_domain) is first
+    build_mo(tmp_path / "more", "web_probe", "it", {"Hello": "Ciao"})
+    global_registry.register_domain("web_probe", str(tmp_path / "more"), source="test")
+    assert i18n_core.negotiate_locale("it, fr", web_domain)[:2] == ("it", "it_IT")
+
+
+def test_chain_translates_per_request(web_domain):
+    chain = i18n_core.negotiate_locale("fr", web_domain)
+    with i18n_core.use_locale(chain[0], languages=chain):
+        assert i18n_core.gettext_many(["Hello"], domain=web_domain) == ["Hello-fr_CA"]
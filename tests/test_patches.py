@@ -0,0 +1,40 @@
+"""Tests for the frozen-app Babel data patches."""
+
+import os
+import shutil
+
+import babel.core
+import babel.localedata
+import pytest
+
+from i18n_core import patches
+
+
+@pytest.fixture
+def embedded(tmp_path):
+    saved = (babel.core._global_data, babel.localedata._dirname)
+    babel_dir = tmp_path / "babel"
+    babel_dir.mkdir()
+    shutil.copy(os.path.join(os.path.dirname(babel.core.__file__), "global.dat"), babel_dir / "global.dat")
+    yield tmp_path
+    babel.core._global_data, babel.localedata._dirname = saved
+
+
+def test_global_data_loaded_on_first_lookup(embedded):
+    patches.apply(str(embedded))
+    data = babel.core._global_data
+    assert isinstance(data, patches._LazyGlobalData)
+    assert not data.loaded
+    assert babel.core.get_global("zone_aliases")
+    assert data.loaded
+    assert babel.localedata._dirname == os.path.join(str(embedded), "locale-data")
+
+
+def test_marshal_copy_preferred(embedded):
+    babel.core.get_global("zone_aliases")
+    expected = dict(babel.core._global_data)
+    path = patches.export_global_data(str(embedded / "babel"))
+    os.unlink(embedded / "babel" / "global.dat")
+    patches.apply(str(embedded))
+    assert babel.core.get_global("zone_aliases") == expected["zone_aliases"]
+    assert os.path.basename(path) == patches.GLOBAL_DATA_MARSHAL
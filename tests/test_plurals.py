@@ -0,0 +1,89 @@
+"""Tests for shared plural evaluators and ngettext_array."""
+
+import pytest
+
+import i18n_core
+from i18n_core import plurals
+from i18n_core.mofile import MappedTranslations
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+def test_evaluators_are_interned_by_normalized_expression():
+    a = plurals.evaluator("nplurals=2; plural=(n != 1);")
+    b = plurals.evaluator("nplurals=2;plural=(n!=1)")
+    assert a is b
+    assert [a(n) for n in (0, 1, 2)] == [1, 0, 1]
+    assert plurals.evaluator("nplurals=2; plural=(n > 1);") is not a
+
+
+def test_missing_rule_uses_germanic_plural():
+    assert plurals.evaluator("nplurals=2") is plurals.germanic_plural
+
+
+def test_catalogs_share_one_evaluator(tmp_path):
+    build_mo(tmp_path, "plural_a", "de", {"file": ("Datei", "Dateien")})
+    build_mo(tmp_path, "plural_b", "de", {"item": ("Element", "Elemente")})
+    reg = _Registry()
+    reg.register_domain("plural_a", str(tmp_path))
+    reg.register_domain("plural_b", str(tmp_path))
+    reg.set_locale("de_DE")
+    a = reg.get_domain_translations("plural_a")
+    b = reg.get_domain_translations("plural_b")
+    assert a.plural is b.plural
+    mapped = MappedTranslations(str(tmp_path / "de" / "LC_MESSAGES" / "plural_a.mo"))
+    try:
+        assert mapped.plural is a.plural
+    finally:
+        mapped.close()
+
+
+@pytest.fixture
+def pl_domain(tmp_path, global_registry):
+    build_mo(tmp_path, "plural_probe", "pl", {"file": ("plik", "pliki", "plików")})
+    global_registry.register_domain("plural_probe", str(tmp_path), priority=100, source="test")
+    with i18n_core.use_locale("pl_PL"):
+        yield "plural_probe"
+
+
+def test_ngettext_array_matches_ngettext(pl_domain):
+    counts = [1, 2, 5, 22, 25, 1, 0, 112]
+    expected = i18n_core.ngettext_many([("file", "files")] * len(counts), counts, domain=pl_domain)
+    assert i18n_core.ngettext_array("file", "files", counts, domain=pl_domain) == expected
+    assert expected[:3] == ["plik", "pliki", "plików"]
+
+
+def test_ngettext_array_accepts_iterators(pl_domain):
+    assert i18n_core.ngettext_array("file", "files", iter([1, 3]), domain=pl_domain) == ["plik", "pliki"]
+    assert i18n_core.ngettext_array("file", "files", [], domain=pl_domain) == []
+
+
+def test_ngettext_array_untranslated(pl_domain):
+    assert i18n_core.ngettext_array("dir", "dirs", [1, 2], domain=pl_domain) == ["dir", "dirs"]
+
+
+def test_ngettext_array_numpy(pl_domain):
+    np = pytest.importorskip("numpy")
+    counts = np.array([1, 2, 5, 2, 1])
+    assert i18n_core.ngettext_array("file", "files", counts, domain=pl_domain) == [
+        "plik",
+        "pliki",
+        "plików",
+        "pliki",
+        "plik",
+    ]
+
+
+@pytest.mark.parametrize("locale_id", ["fr_FR", "ja_JP"])
+def test_ngettext_array_untranslated_falls_back_on_one(tmp_path, global_registry, locale_id):
+    # fr maps 0 and 1 to the same form, ja has a single form
+    build_mo(tmp_path, "fallback_probe", locale_id.split("_")[0], {"Hello": "Salut"})
+    global_registry.register_domain("fallback_probe", str(tmp_path), source="test")
+    with i18n_core.use_locale(locale_id):
+        t = global_registry.get_domain_translations("fallback_probe")
+        assert t.plural(0) == t.plural(1)
+        counts = [0, 1, 2]
+        expected = [t.ngettext("item", "items", n) for n in counts]
+        assert expected == ["items", "item", "items"]
+        assert i18n_core.ngettext_array("item", "items", counts, domain="fallback_probe") == expected
@@ -0,0 +1,241 @@
+"""Tests for _Registry catalog caching."""
+
+import pytest
+
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+class _ForbiddenLock:
+    def __enter__(self):
+        raise AssertionError("lock taken on the read path")
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def registry(tmp_path):
+    reg = _Registry()
+    build_mo(tmp_path, "app", "en_US", {"Hello": "Hello-EN"})
+    build_mo(tmp_path, "app", "de", {"Hello": "Hallo"})
+    reg.register_domain("app", str(tmp_path), priority=100, source="test")
+    reg.set_locale("en_US")
+    return reg
+
+
+def test_cache_hit_does_not_take_lock(registry):
+    first = registry.get_domain_translations("app")
+    registry._lock = _ForbiddenLock()
+    assert registry.get_domain_translations("app") is first
+    assert first.gettext("Hello") == "Hello-EN"
+
+
+def test_use_locale_on_cached_chain_does_not_take_lock(registry):
+    with registry.use_locale("de_DE"):
+        de = registry.get_domain_translations("app")
+    registry._lock = _ForbiddenLock()
+    with registry.use_locale("de_DE"):
+        assert registry.get_domain_translations("app") is de
+
+
+def test_set_locale_switches_chain(registry):
+    registry.get_domain_translations("app")
+    registry.set_locale("de_DE")
+    assert registry.get_domain_translations("app").gettext("Hello") == "Hallo"
+
+
+def test_switching_back_reuses_cached_catalog(registry):
+    en = registry.get_domain_translations("app")
+    registry.set_locale("de_DE")
+    registry.get_domain_translations("app")
+    registry.set_locale("en_US")
+    assert registry.get_domain_translations("app") is en
+
+
+def test_least_recently_used_locale_is_evicted(registry):
+    registry.set_max_cached_locales(2)
+    en = registry.get_domain_translations("app")
+    for locale_id in ("de_DE", "fr_FR"):
+        registry.set_locale(locale_id)
+        registry.get_domain_translations("app")
+    assert ("app", ("en_US", "en")) not in registry._cache
+    registry.set_locale("en_US")
+    assert registry.get_domain_translations("app") is not en
+
+
+def test_context_overrides_do_not_evict_the_global_chain(registry):
+    registry.set_max_cached_locales(2)
+    en = registry.get_domain_translations("app")
+    for locale_id in ("de_DE", "fr_FR", "it_IT"):
+        with registry.use_locale(locale_id):
+            registry.get_domain_translations("app")
+    assert registry.get_domain_translations("app") is en
+    assert ("app", ("de_DE", "de")) not in registry._cache
+
+
+def test_preload_fills_cache_for_requested_locales(registry, tmp_path):
+    build_mo(tmp_path, "other", "de", {"Bye": "Tschüss"})
+    registry.register_domain("other", str(tmp_path), source="test")
+    assert registry.preload(locales=["en_US", "de_DE"], max_workers=4) == 4
+    registry._lock = _ForbiddenLock()
+    registry._chain = ("de_DE", "de")
+    assert registry.get_domain_translations("other").gettext("Bye") == "Tschüss"
+    assert registry.get_domain_translations("app").gettext("Hello") == "Hallo"
+
+
+def test_preload_in_background(registry):
+    future = registry.preload(background=True)
+    assert future.result(timeout=10) == 1
+    assert registry.preload() == 0
+
+
+def test_preload_shares_the_load_with_a_concurrent_lookup(registry):
+    import threading
+
+    started, release = threading.Event(), threading.Event()
+    builds = []
+    build = registry._build_domain
+
+    def blocking_build(domain, chain):
+        builds.append(domain)
+        started.set()
+        assert release.wait(5)
+        return build(domain, chain)
+
+    registry._build_domain = blocking_build
+    future = registry.preload(background=True)
+    assert started.wait(5)
+    lookup = threading.Thread(target=registry.get_domain_translations, args=("app",))
+    lookup.start()
+    release.set()
+    lookup.join(5)
+    assert future.result(timeout=5) == 1
+    assert builds == ["app"]
+
+
+def test_registering_another_domain_keeps_cached_catalogs(registry, tmp_path):
+    app = registry.get_domain_translations("app")
+    build_mo(tmp_path / "plugin", "plugin", "en_US", {"Hello": "Plugin"})
+    registry.register_domain("plugin", str(tmp_path / "plugin"), source="test")
+    assert registry.get_domain_translations("app") is app
+
+
+def test_top_priority_provider_is_layered_onto_cached_catalog(registry, tmp_path):
+    build_mo(tmp_path / "extra", "app", "en_US", {"Hello": "Hello-Extra", "Bye": "Bye-Extra"})
+    build_mo(tmp_path / "low", "app", "en_US", {"Hello": "Hello-Low", "Low": "Low-EN"})
+    before = registry.get_domain_translations("app")
+    registry.register_domain("app", str(tmp_path / "extra"), priority=200, source="test")
+    registry.register_domain("app", str(tmp_path / "low"), priority=10, source="test")
+    registry.reset_stats()
+    after = registry.get_domain_translations("app")
+    assert (after.gettext("Hello"), after.gettext("Bye"), after.gettext("Low")) == ("Hello-Extra", "Bye-Extra", "Low-EN")
+    # The published catalog was copied, not merged into
+    assert before.gettext("Bye") == "Bye"
+
+    registry.register_domain("app", str(tmp_path / "top"), priority=300, source="test")
+    registry.reset_stats()
+    layered = registry.get_domain_translations("app")
+    assert layered.gettext("Hello") == "Hello-Extra"
+    # The existing providers' files were not read again
+    assert [path for _, path in registry._stats.loads] == []
+
+
+def test_concurrent_misses_share_one_load_without_blocking_other_keys(registry, tmp_path):
+    import threading
+
+    build_mo(tmp_path, "slow", "en_US", {"Hello": "Slow"})
+    registry.register_domain("slow", str(tmp_path), priority=100, source="test")
+    started, release = threading.Event(), threading.Event()
+    builds = []
+    build = registry._build_domain
+
+    def blocking_build(domain, chain):
+        builds.append(domain)
+        if domain == "slow":
+            started.set()
+            assert release.wait(5)
+        return build(domain, chain)
+
+    registry._build_domain = blocking_build
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_domain_translations("slow"))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    # Another domain loads while "slow" is still reading its files
+    assert registry.get_domain_translations("app").gettext("Hello") == "Hello-EN"
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert builds.count("slow") == 1
+    assert len(results) == 4 and all(t is results[0] for t in results)
+    # Only the thread that ran the load counts a miss
+    assert registry.stats()["domains"]["slow"]["misses"] == 1
+    assert registry.get_domain_translations("slow") is results[0]
+
+
+def _block_first_build(registry, domain):
+    import threading
+
+    started, release = threading.Event(), threading.Event()
+    build = registry._build_domain
+    calls = []
+
+    def blocking_build(d, chain, backend=None):
+        calls.append(d)
+        if d == domain and calls.count(d) == 1:
+            started.set()
+            assert release.wait(5)
+        return build(d, chain, backend)
+
+    registry._build_domain = blocking_build
+    return started, release
+
+
+def _set_locale_translating(registry, locale_id, release):
+    # A locale listener runs under the registry lock and looks up a key another thread is loading
+    import threading
+
+    seen = []
+
+    def listener(_):
+        release.set()
+        seen.append(registry.get_domain_translations("app").gettext("Hello"))
+
+    registry.on_locale_change(listener)
+    setter = threading.Thread(target=registry.set_locale, args=(locale_id,), daemon=True)
+    setter.start()
+    setter.join(5)
+    assert not setter.is_alive(), "set_locale deadlocked"
+    return seen
+
+
+def test_locale_listener_does_not_deadlock_on_background_preload(registry):
+    started, release = _block_first_build(registry, "app")
+    loaded = registry.preload(locales=["de"], background=True)
+    assert started.wait(5)
+    assert _set_locale_translating(registry, "de", release) == ["Hallo"]
+    loaded.result(5)
+    assert registry.get_domain_translations("app").gettext("Hello") == "Hallo"
+
+
+def test_locale_listener_does_not_deadlock_on_context_locale_load(registry):
+    import threading
+
+    started, release = _block_first_build(registry, "app")
+    results = []
+
+    def request():
+        with registry.use_locale("de_DE"):
+            results.append(registry.get_domain_translations("app").gettext("Hello"))
+
+    worker = threading.Thread(target=request, daemon=True)
+    worker.start()
+    assert started.wait(5)
+    assert _set_locale_translating(registry, "de_DE", release) == ["Hallo"]
+    worker.join(5)
+    assert results == ["Hallo"]
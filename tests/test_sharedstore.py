@@ -0,0 +1,77 @@
+"""Tests for exporting merged catalogs and attaching to them from another registry."""
+
+import os
+
+import pytest
+
+from i18n_core.mofile import MappedTranslations
+from i18n_core.registry import _Registry
+
+from .mo_helpers import build_mo
+
+
+def _registry(root):
+    reg = _Registry()
+    reg.register_domain("shared", str(root / "lib"), priority=50, source="test")
+    reg.register_domain("shared", str(root / "app"), priority=100, source="test")
+    reg.set_locale("de_DE")
+    return reg
+
+
+@pytest.fixture
+def store(tmp_path):
+    build_mo(tmp_path / "lib", "shared", "de", {"Open": "Öffnen", "Close": "Schließen-lib", "file": ("Datei", "Dateien")})
+    build_mo(tmp_path / "app", "shared", "de", {"Close": "Schließen"})
+    manifest = _registry(tmp_path).export_shared(str(tmp_path / "store"), locales=["de_DE", "fr_FR"])
+    return tmp_path, manifest
+
+
+def test_attached_catalog_matches_merged_catalog(store):
+    root, manifest = store
+    reg = _registry(root)
+    assert reg.attach_shared(manifest) == 2
+    t = reg.get_domain_translations("shared")
+    assert isinstance(t, MappedTranslations)
+    assert (t.gettext("Open"), t.gettext("Close")) == ("Öffnen", "Schließen")
+    assert [t.ngettext("file", "files", n) for n in (1, 2)] == ["Datei", "Dateien"]
+    assert t.gettext("Missing") == "Missing"
+
+
+def test_changed_sources_are_not_attached(store):
+    root, manifest = store
+    os.utime(root / "app" / "de" / "LC_MESSAGES" / "shared.mo", ns=(0, 0))
+    reg = _registry(root)
+    assert reg.attach_shared(manifest) == 1  # only the fr chain, which uses no files
+    assert not isinstance(reg.get_domain_translations("shared"), MappedTranslations)
+
+
+def test_different_providers_are_not_attached(store):
+    root, manifest = store
+    reg = _Registry()
+    reg.register_domain("shared", str(root / "lib"), priority=50, source="test")
+    reg.set_locale("de_DE")
+    assert reg.attach_shared(manifest) == 0
+    assert reg.get_domain_translations("shared").gettext("Close") == "Schließen-lib"
+
+
+def test_plugin_registered_over_attached_catalog_keeps_lower_providers(store, tmp_path):
+    root, manifest = store
+    reg = _registry(root)
+    assert reg.attach_shared(manifest) == 2
+    build_mo(tmp_path / "plugin", "shared", "de", {"Plugin": "Erweiterung"})
+    reg.register_domain("shared", str(tmp_path / "plugin"), priority=200, source="test")
+    t = reg.get_domain_translations("shared")
+    assert (t.gettext("Open"), t.gettext("Close"), t.gettext("Plugin")) == ("Öffnen", "Schließen", "Erweiterung")
+
+
+def test_mmap_backend_catalogs_are_exported_with_their_entries(tmp_path):
+    build_mo(tmp_path / "lib", "shared", "de", {"Open": "Öffnen", "Close": "Schließen-lib"})
+    build_mo(tmp_path / "app", "shared", "de", {"Close": "Schließen"})
+    source = _registry(tmp_path)
+    source.set_catalog_backend("mmap")
+    assert isinstance(source.get_domain_translations("shared"), MappedTranslations)
+    manifest = source.export_shared(str(tmp_path / "store"))
+    reg = _registry(tmp_path)
+    assert reg.attach_shared(manifest) == 1
+    t = reg.get_domain_translations("shared")
+    assert (t.gettext("Open"), t.gettext("Close")) == ("Öffnen", "Schließen")
@@ -0,0 +1,90 @@
+"""Tests for hot reloading of changed .mo files."""
+
+import os
+import time
+
+import pytest
+
+from i18n_core.registry import _Registry
+from i18n_core.watcher import CatalogWatcher
+
+from .mo_helpers import build_mo
+
+
+def _touch_newer(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def setup(tmp_path):
+    build_mo(tmp_path, "app", "en_US", {"Hello": "Hello"})
+    de_mo = build_mo(tmp_path, "app", "de", {"Hello": "Hallo"})
+    build_mo(tmp_path, "other", "de", {"Bye": "Tschüss"})
+    reg = _Registry()
+    reg.register_domain("app", str(tmp_path), source="test")
+    reg.register_domain("other", str(tmp_path), source="test")
+    reg.set_locale("en_US")
+    en = reg.get_domain_translations("app")
+    reg.set_locale("de_DE")
+    reg.get_domain_translations("app")
+    other = reg.get_domain_translations("other")
+    return reg, tmp_path, de_mo, en, other
+
+
+def test_check_reloads_only_affected_catalogs(setup):
+    reg, root, de_mo, en, other = setup
+    watcher = CatalogWatcher(reg)
+    assert watcher.check() == 0
+    generation = reg.generation
+
+    build_mo(root, "app", "de", {"Hello": "Servus"})
+    _touch_newer(de_mo)
+    assert watcher.check() == 1
+    assert reg.get_domain_translations("app").gettext("Hello") == "Servus"
+    assert reg.get_domain_translations("other") is other
+    assert reg._cache[("app", ("en_US", "en"))] is en
+    assert reg.generation > generation
+
+
+def test_new_locale_file_is_picked_up(setup):
+    reg, root, _, _, _ = setup
+    reg.set_locale("fr_FR")
+    assert reg.get_domain_translations("app").gettext("Hello") == "Hello"
+    watcher = CatalogWatcher(reg)
+    watcher.check()
+    build_mo(root, "app", "fr", {"Hello": "Bonjour"})
+    assert watcher.check() == 1
+    assert reg.get_domain_translations("app").gettext("Hello") == "Bonjour"
+
+
+def test_background_thread_polls(setup):
+    reg, root, de_mo, _, _ = setup
+    watcher = CatalogWatcher(reg, interval=0.05, backend="poll").start()
+    try:
+        build_mo(root, "app", "de", {"Hello": "Moin"})
+        _touch_newer(de_mo)
+        deadline = time.monotonic() + 5
+        while reg.get_domain_translations("app").gettext("Hello") != "Moin" and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert reg.get_domain_translations("app").gettext("Hello") == "Moin"
+    finally:
+        watcher.stop()
+
+
+def test_in_place_rewrite_under_mmap_backend(tmp_path):
+    de_mo = build_mo(tmp_path, "app", "de", {f"key{i}": f"Wert {i}" for i in range(500)})
+    reg = _Registry()
+    reg.set_catalog_backend("mmap")
+    reg.register_domain("app", str(tmp_path), source="test")
+    reg.set_locale("de_DE")
+    watcher = CatalogWatcher(reg)
+    watcher.check()
+    assert reg.get_domain_translations("app").gettext("key499") == "Wert 499"
+    # Truncating rewrite of the loaded file; catalogs keep serving until reloaded
+    build_mo(tmp_path, "app", "de", {"key0": "Neu"})
+    _touch_newer(de_mo)
+    assert reg.get_domain_translations("app").gettext("key499") == "Wert 499"
+    assert watcher.check() == 1
+    assert reg.get_domain_translations("app").gettext("key0") == "Neu"
+    assert reg.get_domain_translations("app").gettext("key499") == "key499"